@@ -17,14 +17,39 @@ import re
 import sys
 import yaml
 import json
+import operator
 import tarfile
 import tempfile
 import shutil
+import pickle
+import hashlib
+import functools
+import numpy as np
 import pandas as pd
 from pathlib import Path
 from collections import defaultdict
 from datetime import datetime
 
+# Loader YAML en C (libyaml) si disponible, sinon loader Python
+try:
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader
+
+# pyahocorasick est optionnel: un seul automate pour tous les identifiants de site
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# pyarrow est optionnel: cache Parquet des onglets Excel entre deux exécutions
+try:
+    import pyarrow
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 
 # =============================================================================
 # FONCTIONS DE CHARGEMENT DE BACKUP ACI
@@ -191,6 +216,11 @@ def find_all_tenants(aci_data: dict) -> list:
     return [get_object_attribute(t, 'name', '') for t in tenants if get_object_attribute(t, 'name', '')]
 
 
+# Tenants Overlay / Underlay: PREFIXE-OL-SUFFIXE / PREFIXE-UL-SUFFIXE
+_TENANT_OL_RE = re.compile(r'^(.+)-OL-(.+)$')
+_TENANT_UL_RE = re.compile(r'^(.+)-UL-(.+)$')
+
+
 def group_tenants_by_prefix(tenants: list) -> dict:
     """
     Groupe les tenants par préfixe (avant -OL ou -UL).
@@ -201,8 +231,8 @@ def group_tenants_by_prefix(tenants: list) -> dict:
     for tenant in tenants:
         tenant_upper = tenant.upper()
 
-        ol_match = re.search(r'^(.+)-OL-(.+)$', tenant_upper)
-        ul_match = re.search(r'^(.+)-UL-(.+)$', tenant_upper)
+        ol_match = _TENANT_OL_RE.search(tenant_upper)
+        ul_match = _TENANT_UL_RE.search(tenant_upper)
 
         if ol_match:
             prefix = ol_match.group(1)
@@ -321,7 +351,139 @@ def find_all_node_ids(aci_data: dict) -> dict:
     return result
 
 
-def match_node_ids_by_last_digits(excel_node_ids: list, backup_node_ids: dict, digits: int = 2) -> dict:
+def load_backup_cached(backup_path: str, cache_dir: str) -> tuple:
+    """
+    Charge un backup ACI et ses node IDs via un cache pickle sur disque.
+
+    La clé du cache est (chemin, mtime, taille) du tar.gz: un nouveau backup
+    ou un fichier modifié invalide automatiquement l'entrée. Une seule entrée
+    est gardée par chemin: les pickles périmés sont supprimés à l'écriture.
+
+    Returns:
+        Tuple (aci_data, {node_id: leaf_name})
+    """
+    if not os.path.exists(backup_path):
+        raise FileNotFoundError(f"Fichier non trouvé: {backup_path}")
+
+    stat = os.stat(backup_path)
+    # Nom du pickle: {hash du chemin}-{hash de (mtime, taille)}.pkl
+    path_prefix = hashlib.sha1(os.path.abspath(backup_path).encode('utf-8')).hexdigest()
+    version = hashlib.sha1(f"{stat.st_mtime_ns}:{stat.st_size}".encode('utf-8')).hexdigest()
+    cache_file = os.path.join(cache_dir, f"{path_prefix}-{version}.pkl")
+
+    if os.path.exists(cache_file):
+        try:
+            with open(cache_file, 'rb') as f:
+                cached = pickle.load(f)
+            return cached['data'], cached['nodes']
+        except (OSError, EOFError, pickle.UnpicklingError):
+            pass  # Cache illisible: on recharge le backup
+
+    data = load_backup(backup_path)
+    node_ids = find_all_node_ids(data)
+
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_file = cache_file + '.tmp'
+        with open(tmp_file, 'wb') as f:
+            pickle.dump({'data': data, 'nodes': node_ids}, f, protocol=5)
+        os.replace(tmp_file, cache_file)
+
+        # Supprimer les versions périmées du même backup
+        for stale in Path(cache_dir).glob(f"{path_prefix}-*.pkl"):
+            if stale.name != os.path.basename(cache_file):
+                stale.unlink(missing_ok=True)
+    except OSError:
+        pass  # Cache non écrit (droits, disque): sans impact sur le résultat
+
+    return data, node_ids
+
+
+def read_excel_sheets(excel_file: str) -> dict:
+    """
+    Lit tous les onglets d'un classeur Excel.
+
+    Un seul classeur ouvert (openpyxl read_only via pandas), fermé après lecture.
+
+    Returns:
+        Dict {onglet: DataFrame}, dans l'ordre du classeur
+    """
+    with pd.ExcelFile(excel_file) as excel:
+        return {sheet_name: pd.read_excel(excel, sheet_name=sheet_name) for sheet_name in excel.sheet_names}
+
+
+def read_excel_sheets_cached(excel_file: str, cache_dir: str) -> dict:
+    """
+    Lit les onglets d'un classeur via un cache Parquet sur disque (pyarrow).
+
+    La clé du cache est (chemin, mtime, taille) du classeur: un fichier modifié
+    invalide automatiquement l'entrée. Une seule entrée est gardée par chemin:
+    les versions périmées sont supprimées à l'écriture. Un onglet non
+    sérialisable en Parquet (types mixtes, en-têtes non texte) désactive
+    simplement le cache.
+
+    Returns:
+        Dict {onglet: DataFrame}, dans l'ordre du classeur
+    """
+    stat = os.stat(excel_file)
+    # Dossier d'entrée: {hash du chemin}-{hash de (mtime, taille)}
+    path_prefix = hashlib.sha1(os.path.abspath(excel_file).encode('utf-8')).hexdigest()
+    version = hashlib.sha1(f"{stat.st_mtime_ns}:{stat.st_size}".encode('utf-8')).hexdigest()
+    entry_dir = os.path.join(cache_dir, f"{path_prefix}-{version}")
+    manifest_file = os.path.join(entry_dir, 'manifest.json')
+
+    if os.path.exists(manifest_file):
+        try:
+            with open(manifest_file, 'r', encoding='utf-8') as f:
+                sheet_names = json.load(f)
+            return {
+                sheet_name: pd.read_parquet(os.path.join(entry_dir, f"{i}.parquet"))
+                for i, sheet_name in enumerate(sheet_names)
+            }
+        except (OSError, ValueError, json.JSONDecodeError, pyarrow.ArrowException):
+            pass  # Cache illisible: on relit le classeur
+
+    sheets = read_excel_sheets(excel_file)
+
+    # Fichiers numérotés (noms d'onglets arbitraires), manifeste écrit en dernier
+    tmp_dir = entry_dir + '.tmp'
+    try:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        os.makedirs(tmp_dir)
+        for i, df in enumerate(sheets.values()):
+            df.to_parquet(os.path.join(tmp_dir, f"{i}.parquet"), compression='zstd', index=False)
+        with open(os.path.join(tmp_dir, 'manifest.json'), 'w', encoding='utf-8') as f:
+            json.dump(list(sheets), f)
+        shutil.rmtree(entry_dir, ignore_errors=True)
+        os.replace(tmp_dir, entry_dir)
+
+        # Supprimer les versions périmées du même classeur
+        for stale in Path(cache_dir).glob(f"{path_prefix}-*"):
+            if stale.is_dir() and stale.name != os.path.basename(entry_dir):
+                shutil.rmtree(stale, ignore_errors=True)
+    except (OSError, ValueError, TypeError, pyarrow.ArrowException):
+        # Cache non écrit (disque, onglet non sérialisable): sans impact sur le résultat
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    return sheets
+
+
+def build_node_suffix_index(backup_node_ids: dict, digits: int = 2) -> dict:
+    """
+    Index inverse des nodes du backup par leurs derniers chiffres.
+
+    Returns:
+        Dict {suffixe: (node_id, leaf_name)} - le premier node rencontré
+        pour un suffixe est conservé.
+    """
+    index = {}
+    for backup_id, leaf_name in backup_node_ids.items():
+        index.setdefault(str(backup_id)[-digits:], (backup_id, leaf_name))
+    return index
+
+
+def match_node_ids_by_last_digits(excel_node_ids: list, backup_node_ids: dict, digits: int = 2,
+                                  suffix_index: dict = None) -> dict:
     """
     Mappe les node IDs de l'Excel aux node IDs du backup par les derniers chiffres.
 
@@ -329,28 +491,35 @@ def match_node_ids_by_last_digits(excel_node_ids: list, backup_node_ids: dict, d
         excel_node_ids: Liste des node IDs de l'Excel
         backup_node_ids: Dict {node_id: leaf_name} du backup
         digits: Nombre de chiffres à matcher (défaut: 2)
+        suffix_index: Index déjà construit par build_node_suffix_index (optionnel)
 
     Returns:
         Dict {excel_node_id: {'backup_node_id': xxx, 'leaf_name': xxx}}
     """
+    if suffix_index is None:
+        suffix_index = build_node_suffix_index(backup_node_ids, digits)
+
     result = {}
 
     for excel_id in excel_node_ids:
         excel_id_str = str(excel_id)
-        excel_suffix = excel_id_str[-digits:] if len(excel_id_str) >= digits else excel_id_str
+        match = suffix_index.get(excel_id_str[-digits:])
+        if match:
+            result[excel_id_str] = {
+                'backup_node_id': match[0],
+                'leaf_name': match[1]
+            }
 
-        for backup_id, leaf_name in backup_node_ids.items():
-            backup_id_str = str(backup_id)
-            backup_suffix = backup_id_str[-digits:] if len(backup_id_str) >= digits else backup_id_str
+    return result
 
-            if excel_suffix == backup_suffix:
-                result[excel_id_str] = {
-                    'backup_node_id': backup_id,
-                    'leaf_name': leaf_name
-                }
-                break
 
-    return result
+# Node profile de leaf: SFXX-<numéro de leaf>-NP
+_NODE_PROFILE_RE = re.compile(r'SF\d+-(\d+)-NP$')
+
+# Interface profile de leaf: FABRIC-LEAF[-LEAF2]-LIP (suffixe insensible à la casse)
+_LIP_RE = re.compile(r'(.*)-LIP', re.IGNORECASE | re.DOTALL)
+# Segments entièrement numériques après le premier (le fabric): les leaf IDs
+_LIP_LEAF_RE = re.compile(r'-(\d+)(?=-|\Z)')
 
 
 def extract_node_profile_suffix(node_profile_name: str) -> str:
@@ -362,7 +531,7 @@ def extract_node_profile_suffix(node_profile_name: str) -> str:
         SFXX-127-NP → 27
     """
     # Chercher le pattern après SFXX- (ou similaire)
-    match = re.search(r'SF\d+-(\d+)-NP$', node_profile_name.upper())
+    match = _NODE_PROFILE_RE.search(node_profile_name.upper())
     if match:
         leaf_num = match.group(1)
         return leaf_num[-2:] if len(leaf_num) >= 2 else leaf_num
@@ -374,25 +543,76 @@ def extract_node_profile_suffix(node_profile_name: str) -> str:
 # FONCTIONS ROUTE CONTROL SITE IDENTIFIERS
 # =============================================================================
 
+# Identifiants de site connus. Le lookahead permet de détecter aussi les
+# occurrences qui se chevauchent (ex: DRVRN → DRV et VRN).
+SITE_IDENTIFIERS = ('DES', 'DRV', 'VRN')
+_SITE_ID_RE = re.compile('(?=(' + '|'.join(SITE_IDENTIFIERS) + '))', re.IGNORECASE)
+_site_automaton = None
+
+
+def _get_site_automaton():
+    """Construit (une fois) l'automate Aho-Corasick des identifiants de site."""
+    global _site_automaton
+    if _site_automaton is None:
+        automaton = ahocorasick.Automaton()
+        for site_id in SITE_IDENTIFIERS:
+            automaton.add_word(site_id, site_id)
+        automaton.make_automaton()
+        _site_automaton = automaton
+    return _site_automaton
+
+
 def find_site_identifiers(names: list) -> set:
     """
     Trouve les identifiants de site (DES, DRV, VRN, etc.) dans une liste de noms.
+
+    Tous les noms sont joints pour un seul balayage (automate Aho-Corasick si
+    pyahocorasick est installé, sinon regex).
     """
-    site_ids = set()
-    patterns = ['DES', 'DRV', 'VRN']
+    if not names:
+        return set()
 
-    for name in names:
-        name_upper = name.upper()
-        for pattern in patterns:
-            if pattern in name_upper:
-                site_ids.add(pattern)
+    text = '\n'.join(names)
+    if AHOCORASICK_AVAILABLE:
+        return {site_id for _, site_id in _get_site_automaton().iter(text.upper())}
 
-    return site_ids
+    return {site_id.upper() for site_id in _SITE_ID_RE.findall(text)}
+
+
+# Entier tel qu'accepté par int() (signe optionnel, séparateurs _ entre chiffres)
+_INT_RE = re.compile(r'[+-]?\d(?:_?\d)*')
+
+# Ligne VLAN,DESCRIPTION valide (fullmatch): VLAN entier, description non vide
+_VLAN_LINE_RE = re.compile(r'\s*(' + _INT_RE.pattern + r')\s*,\s*(\S.*?)\s*', re.S)
+
+# Nom de serveur d'un VLAN pool: tout ce qui précède le premier - ou _
+_POOL_SERVER_RE = re.compile(r'^([^-_]+)')
+_POOL_P1_P2_RE = re.compile(r'P[12]')
+_POOL_P3_P4_RE = re.compile(r'P[34]')
+
+# Préfixe "eth" d'une interface saisie (eth1/1 → 1/1)
+_ETH_PREFIX_RE = re.compile(r'(?i)^eth')
+
+
+@functools.lru_cache(maxsize=64)
+def _get_site_pattern(old_id: str):
+    """Pattern compilé (insensible à la casse) pour un identifiant de site."""
+    return re.compile(re.escape(old_id), re.IGNORECASE)
 
 
 def replace_site_identifier(name: str, old_id: str, new_id: str) -> str:
     """Remplace un identifiant de site dans un nom."""
-    return re.sub(re.escape(old_id), new_id, name, flags=re.IGNORECASE)
+    # Cas courant: tout en majuscules ASCII → simple str.replace, sans regex
+    if (name.isascii() and old_id.isascii() and '\\' not in new_id
+            and name == name.upper() and old_id == old_id.upper()):
+        return name.replace(old_id, new_id)
+    return _get_site_pattern(old_id).sub(new_id, name)
+
+
+def _iface_port_num(iface: str) -> int:
+    """Numéro de port d'une interface '1/N' (clé de tri), 0 sans '/'."""
+    parts = iface.split('/', 2)
+    return int(parts[1]) if len(parts) > 1 else 0
 
 
 class FabricConverter:
@@ -408,6 +628,12 @@ class FabricConverter:
 
         # Données Excel
         self.excel_data = {}  # Dict des DataFrames par onglet
+        self._col_index = {}  # Cache {onglet: (DataFrame, {colonne_minuscule: colonne_réelle})}
+        self._data_version = 0  # Incrémenté à chaque modification de excel_data
+        self._find_cache = {}  # Cache find_all_values {(colonnes, exclusions): (version, résultat)}
+        self._unique_cache = {}  # Cache _unique_values {(onglet, colonne): (version, valeurs)}
+        self._upper = {}  # Cache {nom: NOM} pour tenants/VRF/AP
+        self._yaml_cache = {}  # Cache {(fichier, multi-docs): (mtime, contenu parsé)}
 
         # Données de la fabric de destination
         self.fabric_paths = {}  # Dict {fabric_name: path}
@@ -421,6 +647,7 @@ class FabricConverter:
 
         # Node IDs du backup destination
         self.dest_node_ids = {}  # Dict {node_id: leaf_name}
+        self._nodes_by_suffix = (None, {})  # Cache (dest_node_ids, {suffixe: (node_id, leaf_name)})
 
         # Site identifier pour Route Control
         self.site_identifier_old = None
@@ -454,9 +681,14 @@ class FabricConverter:
         self.interface_config_method = 'odd_even'  # 'odd_even' ou 'manual'
         self.interface_config_type = 'switch_port'
         self.interface_config_profile_to_node = {}
-        self.interface_config_interfaces = []  # Liste de (profile, policy_group, interfaces_str)
+        # Overrides d'interfaces en listes parallèles (une entrée par ligne du config)
+        self.interface_config_profiles = []
+        self.interface_config_policy_groups = []
+        self.interface_config_interface_lists = []  # Liste d'interfaces par ligne
         self.interface_config_node_to_leaf = {}
         self.interface_config_descriptions = []  # Lignes brutes
+        self._parsed_descriptions = None  # Cache du parse de interface_config_descriptions
+        self._sorted_node_ids = None  # Cache des node IDs triés de interface_config_node_to_leaf
 
         # Colonnes à convertir par type
         self.tenant_columns = ['tenant']
@@ -473,6 +705,14 @@ class FabricConverter:
         self.route_control_profile_columns = ['route_control_profile', 'route_control_profile_import', 'route_control_profile_export']
         self.route_control_context_columns = ['route_control_context']
 
+        # Colonnes texte encodées en Categorical au chargement (appartenance O(1))
+        self.categorical_columns = frozenset(
+            self.tenant_columns + self.vrf_columns + self.ap_columns +
+            self.node_profile_columns + self.int_profile_columns + self.path_ep_columns +
+            self.match_rule_columns + self.route_control_profile_columns +
+            self.route_control_context_columns + ['policy_group']
+        )
+
     def load_excel(self):
         """Charge le fichier Excel source"""
         print(f"\n📂 Chargement du fichier Excel: {self.excel_file}")
@@ -481,22 +721,80 @@ class FabricConverter:
             print(f"❌ Fichier non trouvé: {self.excel_file}")
             sys.exit(1)
 
-        excel = pd.ExcelFile(self.excel_file)
-        for sheet_name in excel.sheet_names:
-            self.excel_data[sheet_name] = pd.read_excel(excel, sheet_name=sheet_name)
+        # Cache Parquet si pyarrow est disponible (relectures sans reparser le classeur)
+        if PYARROW_AVAILABLE:
+            sheets = read_excel_sheets_cached(self.excel_file, os.path.join(self.base_dir, '_excel_cache'))
+        else:
+            sheets = read_excel_sheets(self.excel_file)
+
+        for sheet_name, df in sheets.items():
+            self.excel_data[sheet_name] = df
+            self._get_col_index(sheet_name)
+
+        self._categorize_string_columns()
+        self._data_version += 1
 
         print(f"✅ {len(self.excel_data)} onglets chargés")
         return True
 
+    def _categorize_string_columns(self):
+        """
+        Encode en Categorical les colonnes texte très répétitives (tenant, vrf,
+        ap, profils, path_ep): comparaisons et unique() travaillent alors sur
+        des codes entiers au lieu de chaînes Python.
+        """
+        for sheet_name, df in self.excel_data.items():
+            for col_lower, real_col in self._get_col_index(sheet_name).items():
+                if col_lower not in self.categorical_columns:
+                    continue
+                dtype = df[real_col].dtype
+                if isinstance(dtype, pd.CategoricalDtype) or pd.api.types.is_numeric_dtype(dtype):
+                    continue
+                df[real_col] = df[real_col].astype('category')
+
+    def _categorize_interface_columns(self, df):
+        """
+        Encode en Categorical les colonnes quasi constantes d'interface_config
+        (policy_group, role, port_type, interface_type, admin_state): quelques
+        chaînes en mémoire au lieu d'une par ligne.
+        """
+        for col in ('policy_group', 'role', 'port_type', 'interface_type', 'admin_state'):
+            df[col] = df[col].astype('category')
+        return df
+
+    def _add_categories(self, df, real_col, values):
+        """Ajoute les valeurs manquantes aux catégories d'une colonne catégorielle avant écriture"""
+        col = df[real_col]
+        if isinstance(col.dtype, pd.CategoricalDtype):
+            missing = [v for v in values if v not in col.cat.categories]
+            if missing:
+                df[real_col] = col.cat.add_categories(missing)
+
+    def _load_yaml(self, path, all_docs=False):
+        """
+        Parse un fichier YAML avec le loader C si disponible.
+        Le résultat est mis en cache tant que le mtime du fichier ne change pas.
+        """
+        mtime = os.path.getmtime(path)
+        cached = self._yaml_cache.get((path, all_docs))
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        with open(path, 'r', encoding='utf-8') as f:
+            if all_docs:
+                data = list(yaml.load_all(f, Loader=YamlSafeLoader))
+            else:
+                data = yaml.load(f, Loader=YamlSafeLoader)
+
+        self._yaml_cache[(path, all_docs)] = (mtime, data)
+        return data
+
     def load_extraction_list(self):
         """Charge la liste d'extraction (optionnel)"""
         if not os.path.exists(self.extraction_list_file):
             return None
 
-        with open(self.extraction_list_file, 'r', encoding='utf-8') as f:
-            docs = list(yaml.safe_load_all(f))
-
-        return docs
+        return self._load_yaml(self.extraction_list_file, all_docs=True)
 
     def load_fabric_paths(self):
         """Charge la configuration des chemins de fabric."""
@@ -504,8 +802,7 @@ class FabricConverter:
             print(f"   ⚠️  Fichier {self.fabric_paths_file} non trouvé")
             return False
 
-        with open(self.fabric_paths_file, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
+        config = self._load_yaml(self.fabric_paths_file)
 
         self.fabric_paths = config.get('fabrics', {})
         return bool(self.fabric_paths)
@@ -557,11 +854,10 @@ class FabricConverter:
             print(f"   Backup trouvé: {backup_filename}")
 
             print("   Chargement en cours...")
-            self.dest_aci_data = load_backup(self.dest_backup_path)
+            # Backup parsé + node IDs mis en cache sur disque (clé: chemin, mtime, taille)
+            cache_dir = os.path.join(self.base_dir, '_backup_cache')
+            self.dest_aci_data, self.dest_node_ids = load_backup_cached(self.dest_backup_path, cache_dir)
             print("   ✅ Backup chargé avec succès")
-
-            # Charger les node IDs
-            self.dest_node_ids = find_all_node_ids(self.dest_aci_data)
             print(f"   ✅ {len(self.dest_node_ids)} nodes trouvés")
 
             return True
@@ -592,8 +888,7 @@ class FabricConverter:
         if not groups:
             print("\n❌ Aucun groupe de tenants OL/UL trouvé.")
             print("   Tenants trouvés:")
-            for t in tenants[:10]:
-                print(f"   - {t}")
+            sys.stdout.write(''.join(f"   - {t}\n" for t in tenants[:10]))
             return False
 
         # Afficher les groupes
@@ -659,9 +954,18 @@ class FabricConverter:
         print("🔄 MAPPING AUTOMATIQUE TENANT/VRF/AP")
         print("=" * 60)
 
+        # Index insensibles à la casse {NOM_MAJUSCULE: [noms originaux]}
+        upper = self._upper
+        vrf_upper = {}
+        for vrf in unique_values.get('vrfs', []):
+            vrf_upper.setdefault(upper.get(vrf) or vrf.upper(), []).append(vrf)
+        ap_upper = {}
+        for ap in unique_values.get('aps', []):
+            ap_upper.setdefault(upper.get(ap) or ap.upper(), []).append(ap)
+
         # Trouver les tenants OL et UL dans l'Excel
         for tenant in unique_values.get('tenants', []):
-            tenant_upper = tenant.upper()
+            tenant_upper = upper.get(tenant) or tenant.upper()
 
             if '-OL-' in tenant_upper:
                 dest = self.tenant_group['overlay_tenant']
@@ -673,15 +977,13 @@ class FabricConverter:
                 src_vrf = f"{src_base}-OL-VRF"
                 src_anp = f"{src_base}-OL-ANP"
 
-                for vrf in unique_values.get('vrfs', []):
-                    if vrf.upper() == src_vrf.upper():
-                        self.vrf_mapping[vrf] = self.tenant_group['overlay_vrf']
-                        print(f"   VRF OL:    {vrf} → {self.tenant_group['overlay_vrf']}")
+                for vrf in vrf_upper.get(src_vrf.upper(), []):
+                    self.vrf_mapping[vrf] = self.tenant_group['overlay_vrf']
+                    print(f"   VRF OL:    {vrf} → {self.tenant_group['overlay_vrf']}")
 
-                for ap in unique_values.get('aps', []):
-                    if ap.upper() == src_anp.upper():
-                        self.ap_mapping[ap] = self.tenant_group['overlay_anp']
-                        print(f"   ANP OL:    {ap} → {self.tenant_group['overlay_anp']}")
+                for ap in ap_upper.get(src_anp.upper(), []):
+                    self.ap_mapping[ap] = self.tenant_group['overlay_anp']
+                    print(f"   ANP OL:    {ap} → {self.tenant_group['overlay_anp']}")
 
             elif '-UL-' in tenant_upper:
                 dest = self.tenant_group['underlay_tenant']
@@ -693,15 +995,13 @@ class FabricConverter:
                 src_vrf = f"{src_base}-UL-VRF"
                 src_anp = f"{src_base}-UL-ANP"
 
-                for vrf in unique_values.get('vrfs', []):
-                    if vrf.upper() == src_vrf.upper():
-                        self.vrf_mapping[vrf] = self.tenant_group['underlay_vrf']
-                        print(f"   VRF UL:    {vrf} → {self.tenant_group['underlay_vrf']}")
+                for vrf in vrf_upper.get(src_vrf.upper(), []):
+                    self.vrf_mapping[vrf] = self.tenant_group['underlay_vrf']
+                    print(f"   VRF UL:    {vrf} → {self.tenant_group['underlay_vrf']}")
 
-                for ap in unique_values.get('aps', []):
-                    if ap.upper() == src_anp.upper():
-                        self.ap_mapping[ap] = self.tenant_group['underlay_anp']
-                        print(f"   ANP UL:    {ap} → {self.tenant_group['underlay_anp']}")
+                for ap in ap_upper.get(src_anp.upper(), []):
+                    self.ap_mapping[ap] = self.tenant_group['underlay_anp']
+                    print(f"   ANP UL:    {ap} → {self.tenant_group['underlay_anp']}")
 
     def auto_map_l3outs(self):
         """
@@ -763,6 +1063,18 @@ class FabricConverter:
             'dci_ul': dci_ul_l3out
         }
 
+    def _get_nodes_by_suffix(self):
+        """
+        Index {2 derniers chiffres: (node_id, leaf_name)} des nodes destination,
+        partagé par auto_map_node_ids et auto_map_node_profiles.
+        Reconstruit si dest_node_ids a été remplacé.
+        """
+        source, index = self._nodes_by_suffix
+        if source is not self.dest_node_ids:
+            index = build_node_suffix_index(self.dest_node_ids)
+            self._nodes_by_suffix = (self.dest_node_ids, index)
+        return index
+
     def auto_map_node_ids(self):
         """
         Mappe automatiquement les Node IDs par les 2 derniers chiffres.
@@ -793,7 +1105,8 @@ class FabricConverter:
             return False
 
         # Mapper par les 2 derniers chiffres
-        mapping = match_node_ids_by_last_digits(excel_node_ids, self.dest_node_ids)
+        mapping = match_node_ids_by_last_digits(excel_node_ids, self.dest_node_ids,
+                                                suffix_index=self._get_nodes_by_suffix())
 
         if not mapping:
             print("   ⚠️  Aucun mapping trouvé")
@@ -801,8 +1114,10 @@ class FabricConverter:
 
         # Afficher pour confirmation
         print("\n   Mapping auto-détecté:")
-        for excel_id, info in mapping.items():
-            print(f"   • Excel {excel_id} → Backup {info['backup_node_id']} (Leaf: {info['leaf_name']})")
+        sys.stdout.write(''.join(
+            f"   • Excel {excel_id} → Backup {info['backup_node_id']} (Leaf: {info['leaf_name']})\n"
+            for excel_id, info in mapping.items()
+        ))
 
         print("\nConfirmer ce mapping? [O/n]: ", end="", flush=True)
         confirm = input().strip().lower()
@@ -838,22 +1153,19 @@ class FabricConverter:
 
         # Pour chaque node profile Excel, extraire les 2 derniers chiffres
         # et trouver la leaf correspondante dans le backup
-        for np in excel_node_profiles:
-            suffix = extract_node_profile_suffix(np)
+        nodes_by_suffix = self._get_nodes_by_suffix()
+        for profile in excel_node_profiles:
+            suffix = extract_node_profile_suffix(profile)
             if not suffix:
                 continue
 
-            # Chercher la leaf qui se termine par ces 2 chiffres
-            for node_id, leaf_name in self.dest_node_ids.items():
-                # Extraire les 2 derniers chiffres du node_id
-                node_suffix = str(node_id)[-2:] if len(str(node_id)) >= 2 else str(node_id)
-
-                if suffix == node_suffix:
-                    # Construire le nouveau node profile
-                    dest_np = f"{leaf_name}-NP"
-                    self.node_profile_mapping[np] = dest_np
-                    print(f"   • {np} → {dest_np}")
-                    break
+            # Leaf dont le node_id se termine par ces 2 chiffres
+            match = nodes_by_suffix.get(suffix)
+            if match:
+                # Construire le nouveau node profile
+                dest_np = f"{match[1]}-NP"
+                self.node_profile_mapping[profile] = dest_np
+                print(f"   • {profile} → {dest_np}")
 
         print(f"\n   ✅ {len(self.node_profile_mapping)} node profiles mappés")
 
@@ -895,8 +1207,7 @@ class FabricConverter:
 
         if len(site_ids) > 1:
             print(f"\n   Plusieurs identifiants trouvés. Lequel remplacer?")
-            for i, sid in enumerate(site_ids, 1):
-                print(f"   {i}) {sid}")
+            sys.stdout.write(''.join(f"   {i}) {sid}\n" for i, sid in enumerate(site_ids, 1)))
             print(f"\n   Choix [1]: ", end="", flush=True)
             choice = input().strip()
             try:
@@ -907,6 +1218,47 @@ class FabricConverter:
 
         print(f"\n   ✅ Remplacement: {self.site_identifier_old} → {self.site_identifier_new}")
 
+    def _get_col_index(self, sheet_name):
+        """
+        Retourne le dict {nom_colonne_minuscule: nom_colonne_réel} d'un onglet.
+
+        Calculé une seule fois par DataFrame; reconstruit automatiquement si
+        l'onglet a été remplacé (ex: split des encap blocks).
+        """
+        df = self.excel_data[sheet_name]
+        cached = self._col_index.get(sheet_name)
+        if cached is not None and cached[0] is df:
+            return cached[1]
+
+        col_index = {}
+        for c in df.columns:
+            # Garder la première colonne en cas de doublon (comme list.index)
+            col_index.setdefault(str(c).lower(), c)
+        self._col_index[sheet_name] = (df, col_index)
+        return col_index
+
+    def _find_col(self, sheet_name, candidates):
+        """
+        Retourne la colonne réelle du premier nom candidat présent dans l'onglet
+        (insensible à la casse), ou None. Lookup dict via _get_col_index.
+        """
+        col_index = self._get_col_index(sheet_name)
+        return next((col_index[c] for c in candidates if c in col_index), None)
+
+    def _unique_values(self, sheet_name, real_col):
+        """
+        Valeurs uniques non nulles d'une colonne (ordre d'apparition), en ndarray.
+        Mises en cache tant que excel_data n'est pas modifié (_data_version).
+        """
+        cache_key = (sheet_name, real_col)
+        cached = self._unique_cache.get(cache_key)
+        if cached is not None and cached[0] == self._data_version:
+            return cached[1]
+
+        values = pd.unique(self.excel_data[sheet_name][real_col].dropna().to_numpy())
+        self._unique_cache[cache_key] = (self._data_version, values)
+        return values
+
     def truncate_value(self, value, max_len=25):
         """Tronque une valeur si trop longue"""
         s = str(value) if pd.notna(value) else ''
@@ -914,63 +1266,93 @@ class FabricConverter:
             return s[:max_len-3] + "..."
         return s
 
-    def format_row_display(self, row, headers, max_cols=6):
-        """Formate une ligne pour affichage avec troncature"""
-        parts = []
-        for i, (val, hdr) in enumerate(zip(row, headers)):
-            if i >= max_cols:
-                parts.append("...")
-                break
-            truncated = self.truncate_value(val, 20)
-            parts.append(f"{hdr}={truncated}")
+    def _stringify_row(self, row, max_cols=6):
+        """
+        Convertit les max_cols premières valeurs d'une ligne en texte tronqué
+        (20 caractères, voir truncate_value), une seule fois par ligne. NaN → ''.
+        """
+        return [self.truncate_value(value, 20) for value in row[:max_cols]]
+
+    def format_row_display(self, row_str, headers, max_cols=6):
+        """
+        Formate une ligne pour affichage.
+        row_str: valeurs déjà converties et tronquées (voir _stringify_row)
+        """
+        parts = [f"{hdr}={val}" for val, hdr in zip(row_str, headers[:max_cols])]
+        if len(headers) > max_cols:
+            parts.append("...")
         return " | ".join(parts)
 
     def find_all_values(self, column_list, exclude_sheets=None):
         """
         Trouve les valeurs uniques dans TOUS les onglets.
-        Retourne un dict avec les valeurs et leur contexte.
+        Retourne un dict avec les valeurs et leur contexte
+        ({'sheet_name', 'row_index'}, la ligne est lue à l'affichage).
         exclude_sheets: liste d'onglets à exclure de la recherche
+
+        Résultat mis en cache tant que excel_data n'est pas modifié (_data_version).
         """
+        cache_key = (tuple(column_list), tuple(exclude_sheets or ()))
+        cached = self._find_cache.get(cache_key)
+        if cached is not None and cached[0] == self._data_version:
+            return cached[1]
+
         values_with_context = {}
+        sheets_by_value = {}  # {valeur: set(onglets)} pour éviter les doublons de contexte
         exclude_sheets = exclude_sheets or []
 
         for sheet_name, df in self.excel_data.items():
             # Ignorer les onglets exclus
             if sheet_name in exclude_sheets:
                 continue
-            columns_lower = [str(c).lower() for c in df.columns]
+            col_index = self._get_col_index(sheet_name)
 
             for col_name in column_list:
-                if col_name in columns_lower:
-                    idx = columns_lower.index(col_name)
-                    real_col = df.columns[idx]
-
-                    for _, row in df.iterrows():
-                        val = row[real_col]
-                        if pd.notna(val):
-                            val_str = str(val).strip()
-                            # Pour les node_id, normaliser en int
-                            if col_name == 'node_id':
-                                try:
-                                    val_str = str(int(float(val_str)))
-                                except (ValueError, TypeError):
-                                    continue
-
-                            if val_str and val_str not in values_with_context:
-                                values_with_context[val_str] = []
-
-                            if val_str:
-                                # Ajouter le contexte
-                                context = {
-                                    'sheet_name': sheet_name,
-                                    'headers': list(df.columns),
-                                    'row': row.tolist()
-                                }
-                                # Éviter les doublons de contexte
-                                existing_sheets = [c['sheet_name'] for c in values_with_context.get(val_str, [])]
-                                if sheet_name not in existing_sheets:
-                                    values_with_context[val_str].append(context)
-
+                real_col = col_index.get(col_name)
+                if real_col is not None:
+                    # Traitement vectorisé de la colonne (positions 0..n-1)
+                    col_data = df[real_col].reset_index(drop=True)
+                    dtype = col_data.dtype
+                    if isinstance(dtype, pd.CategoricalDtype):
+                        # Colonne catégorielle: première position de chaque code
+                        codes = col_data.cat.codes.to_numpy()
+                        valid = np.flatnonzero(codes >= 0)
+                        uniq_codes, first = np.unique(codes[valid], return_index=True)
+                        order = np.argsort(first)
+                        labels = col_data.cat.categories.astype(str).str.strip()
+                        series = pd.Series(labels[uniq_codes[order]].to_numpy(),
+                                           index=valid[first[order]])
+                    elif pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype):
+                        # Colonne numérique: pas de strip ni de to_numeric
+                        series = col_data.dropna()
+                        # Pour les node_id (ou entiers), normaliser en int
+                        if col_name == 'node_id' or pd.api.types.is_integer_dtype(dtype):
+                            series = series.astype('int64')
+                        series = series.astype(str)
+                    else:
+                        series = col_data.dropna().astype(str).str.strip()
+                        # Pour les node_id, normaliser en int
+                        if col_name == 'node_id':
+                            series = pd.to_numeric(series, errors='coerce').dropna()
+                            series = series.astype('int64').astype(str)
+                    series = series[series != '']
+
+                    # Première occurrence de chaque valeur dans l'onglet
+                    first_rows = series[~series.duplicated()]
+
+                    for pos, val_str in first_rows.items():
+                        contexts = values_with_context.setdefault(val_str, [])
+                        seen_sheets = sheets_by_value.setdefault(val_str, set())
+
+                        # Éviter les doublons de contexte
+                        if sheet_name not in seen_sheets:
+                            seen_sheets.add(sheet_name)
+                            contexts.append({
+                                'sheet_name': sheet_name,
+                                'row_index': pos
+                            })
+
+        self._find_cache[cache_key] = (self._data_version, values_with_context)
         return values_with_context
 
     def display_value_context_improved(self, value, contexts):
@@ -983,13 +1365,16 @@ class FabricConverter:
 
         for ctx in contexts[:3]:  # Limiter à 3 contextes
             print(f"      ┌─ Onglet: {ctx['sheet_name']}")
+            df = self.excel_data[ctx['sheet_name']]
+            headers = list(df.columns)
             # Afficher seulement les colonnes pertinentes (premières colonnes)
-            headers_display = ctx['headers'][:8]
-            if len(ctx['headers']) > 8:
+            headers_display = headers[:8]
+            if len(headers) > 8:
                 headers_display = headers_display + ['...']
             print(f"      │  Colonnes: {', '.join(str(h) for h in headers_display)}")
-            # Afficher la ligne formatée
-            row_display = self.format_row_display(ctx['row'], ctx['headers'])
+            # Afficher la ligne formatée (lue seulement maintenant)
+            row_str = self._stringify_row(df.iloc[ctx['row_index']].tolist())
+            row_display = self.format_row_display(row_str, headers)
             print(f"      └─ Données: {row_display}")
 
         if len(contexts) > 3:
@@ -997,35 +1382,42 @@ class FabricConverter:
 
     def discover_global_values(self):
         """Découvre les valeurs globales (tenant, vrf, ap)"""
-        unique_values = {
-            'tenants': set(),
-            'vrfs': set(),
-            'aps': set()
+        # Tableaux numpy accumulés par onglet, dédupliqués en une seule passe
+        arrays = {
+            'tenants': [],
+            'vrfs': [],
+            'aps': []
         }
 
-        for sheet_name, df in self.excel_data.items():
-            columns = [str(c).lower() for c in df.columns]
+        for sheet_name in self.excel_data:
+            col_index = self._get_col_index(sheet_name)
 
             for col in self.tenant_columns:
-                if col in columns:
-                    idx = columns.index(col)
-                    real_col = df.columns[idx]
-                    unique_values['tenants'].update(df[real_col].dropna().unique())
+                real_col = col_index.get(col)
+                if real_col is not None:
+                    arrays['tenants'].append(self._unique_values(sheet_name, real_col))
 
             for col in self.vrf_columns:
-                if col in columns:
-                    idx = columns.index(col)
-                    real_col = df.columns[idx]
-                    unique_values['vrfs'].update(df[real_col].dropna().unique())
+                real_col = col_index.get(col)
+                if real_col is not None:
+                    arrays['vrfs'].append(self._unique_values(sheet_name, real_col))
 
             for col in self.ap_columns:
-                if col in columns:
-                    idx = columns.index(col)
-                    real_col = df.columns[idx]
-                    unique_values['aps'].update(df[real_col].dropna().unique())
-
-        for key in unique_values:
-            unique_values[key] = sorted([str(v) for v in unique_values[key] if v and str(v).strip()])
+                real_col = col_index.get(col)
+                if real_col is not None:
+                    arrays['aps'].append(self._unique_values(sheet_name, real_col))
+
+        unique_values = {}
+        for key, key_arrays in arrays.items():
+            # pd.unique (hash) plutôt que np.unique (tri) : tolère les types mixtes
+            vals = pd.unique(np.concatenate(key_arrays)) if key_arrays else np.array([])
+            unique_values[key] = sorted([str(v) for v in vals if v and str(v).strip()])
+
+        # Formes majuscules calculées une seule fois (réutilisées par les mappings auto)
+        for values in unique_values.values():
+            for v in values:
+                if v not in self._upper:
+                    self._upper[v] = v.upper()
 
         return unique_values
 
@@ -1048,6 +1440,75 @@ class FabricConverter:
             return default if default else source_value
         return user_input
 
+    def prompt_mapping_batch(self, prompt_text, items):
+        """
+        Demande plusieurs mappings d'une même catégorie en un seul bloc.
+
+        Toutes les questions sont affichées d'un coup (numérotées), puis une
+        réponse est lue par ligne (Entrée = suggestion). Si stdin n'est pas un
+        terminal (pipe), repli sur prompt_mapping élément par élément.
+
+        Args:
+            prompt_text: Libellé de la catégorie (ex: "Match Rule")
+            items: Liste de tuples (valeur_source, suggestion)
+
+        Returns:
+            Liste des valeurs destination, dans l'ordre de items
+        """
+        if not sys.stdin.isatty():
+            return [self.prompt_mapping(prompt_text, source, default) for source, default in items]
+
+        width = len(str(len(items)))
+        lines = []
+        for i, (source, default) in enumerate(items, 1):
+            suggestion = f"[{default}]" if default else ""
+            lines.append(f"   {i:>{width}}. {prompt_text} [{source}] → {suggestion}")
+        print("\n".join(lines))
+        print(f"   Une réponse par ligne (Entrée = suggestion):")
+
+        results = []
+        for i, (source, default) in enumerate(items, 1):
+            print(f"   {i:>{width}}> ", end="", flush=True)
+            user_input = input().strip()
+            results.append(user_input if user_input else (default if default else source))
+        return results
+
+    def read_pasted_lines(self, empty_lines_to_stop=1):
+        """
+        Lit un bloc de lignes collées jusqu'à empty_lines_to_stop lignes vides.
+
+        En terminal, lecture par input(). Si stdin est un pipe, les lignes sont
+        lues directement dans le tampon de sys.stdin (lectures par blocs, sans
+        appel input() par ligne). La lecture s'arrête au terminateur pour que
+        les réponses suivantes restent disponibles.
+
+        Returns:
+            Liste des lignes non vides (strip)
+        """
+        if sys.stdin.isatty():
+            def raw_lines():
+                while True:
+                    try:
+                        yield input()
+                    except EOFError:
+                        return
+            source = raw_lines()
+        else:
+            source = sys.stdin
+
+        lines = []
+        empty_line_count = 0
+        for line in source:
+            line = line.strip()
+            if not line:
+                empty_line_count += 1
+                if empty_line_count >= empty_lines_to_stop:
+                    break
+            else:
+                empty_line_count = 0
+                lines.append(line)
+        return lines
+
     def collect_global_mappings(self, unique_values, skip_auto_mapped=False):
         """Collecte les mappings globaux (tenant → auto VRF/AP)"""
         # Tenants avec dérivation automatique VRF/AP
@@ -1122,22 +1583,20 @@ class FabricConverter:
             return
 
         df = self.excel_data['bd_to_l3out']
-        columns_lower = [str(c).lower() for c in df.columns]
+        col_index = self._get_col_index('bd_to_l3out')
 
         # Trouver la colonne l3out
-        l3out_col = None
-        for col_name in ['l3out', 'l3out_name']:
-            if col_name in columns_lower:
-                idx = columns_lower.index(col_name)
-                l3out_col = df.columns[idx]
-                break
+        l3out_col = self._find_col('bd_to_l3out', ['l3out', 'l3out_name'])
 
         if l3out_col is None:
             return
 
+        # Positions des lignes par L3Out, en une seule passe (groupby, NaN exclus):
+        # fournit à la fois les L3Out uniques et les lignes de chacun
+        rows_by_l3out = df.groupby(l3out_col, sort=False).indices
+
         # Extraire les L3Out uniques
-        unique_l3outs = df[l3out_col].dropna().unique()
-        unique_l3outs = sorted([str(v) for v in unique_l3outs if v and str(v).strip()])
+        unique_l3outs = sorted([str(v) for v in rows_by_l3out if v and str(v).strip()])
 
         if not unique_l3outs:
             return
@@ -1164,49 +1623,49 @@ class FabricConverter:
 
         print("\n   (Appuyez sur Entrée pour utiliser la suggestion du backup)")
 
-        # Afficher le contexte pour chaque L3Out
-        for l3out in unique_l3outs:
-            # Trouver les BDs qui référencent ce L3Out
-            mask = df[l3out_col] == l3out
-            matching_rows = df[mask]
+        # Tenants en majuscules calculés une seule fois (C-level)
+        tenant_upper = df['tenant'].astype(str).str.upper().to_numpy() if 'tenant' in col_index else None
+
+        # Colonne BD (identique pour tous les L3Out)
+        bd_col = self._find_col('bd_to_l3out', ['bd', 'bridge_domain'])
+        bd_values = df[bd_col].to_numpy() if bd_col else None
+
+        no_rows = np.empty(0, dtype=np.intp)
+        rows_list = [rows_by_l3out.get(l3out, no_rows) for l3out in unique_l3outs]
+
+        # Tenant associé (OL ou UL) d'après la première BD de chaque L3Out
+        tenant_ol = np.zeros(len(unique_l3outs), dtype=bool)
+        tenant_ul = np.zeros(len(unique_l3outs), dtype=bool)
+        if tenant_upper is not None:
+            has_rows = np.array([len(rows) > 0 for rows in rows_list], dtype=bool)
+            first_rows = np.array([rows[0] if len(rows) else 0 for rows in rows_list], dtype=np.intp)
+            first_tenants = tenant_upper[first_rows].astype(str)
+            tenant_ol = has_rows & (np.char.find(first_tenants, '-OL-') >= 0)
+            tenant_ul = has_rows & ~tenant_ol & (np.char.find(first_tenants, '-UL-') >= 0)
+        tenant_contexts = np.select([tenant_ol, tenant_ul], [" (Overlay)", " (Underlay)"], "")
+
+        # Type de L3Out d'après le nom source, classé en une fois (numpy):
+        # N/S = commence par B et contient -NS- (toujours Overlay),
+        # DCI = commence par DCI, OL si -OL- dans le nom ou tenant Overlay
+        l3out_types = np.full(len(unique_l3outs), "", dtype=object)
+        if backup_l3outs:
+            upper = np.char.upper(np.array(unique_l3outs, dtype=str))
+            is_ns = np.char.startswith(upper, 'B') & (np.char.find(upper, '-NS-') >= 0)
+            is_dci = ~is_ns & np.char.startswith(upper, 'DCI')
+            dci_ol = is_dci & ((np.char.find(upper, '-OL-') >= 0) | tenant_ol)
+            l3out_types = np.select([is_ns, dci_ol, is_dci], ["N/S", "DCI-OL", "DCI-UL"], "")
+
+        # Type → clé de suggestion dans le backup
+        backup_keys = {"N/S": 'ns', "DCI-OL": 'dci_ol', "DCI-UL": 'dci_ul'}
 
+        # Afficher le contexte pour chaque L3Out
+        for l3out, rows, tenant_context, l3out_type in zip(unique_l3outs, rows_list, tenant_contexts, l3out_types):
             print(f"\n   {'─' * 56}")
 
-            # Détecter le tenant associé (OL ou UL)
-            tenant_context = ""
-            if 'tenant' in columns_lower:
-                tenants = matching_rows['tenant'].tolist()
-                if tenants:
-                    first_tenant = str(tenants[0]).upper()
-                    if '-OL-' in first_tenant:
-                        tenant_context = " (Overlay)"
-                    elif '-UL-' in first_tenant:
-                        tenant_context = " (Underlay)"
-
-            # Déterminer la suggestion depuis le backup
-            suggestion = l3out  # Par défaut: garder la même valeur
-            l3out_upper = l3out.upper()
-            l3out_type = ""
-
-            if backup_l3outs:
-                # Détecter le type de L3Out par le nom source
-                first_word = l3out_upper.split('-')[0] if '-' in l3out_upper else l3out_upper
-
-                if first_word.startswith('B') and '-NS-' in l3out_upper:
-                    # C'est un L3Out N/S (toujours dans Overlay)
-                    l3out_type = "N/S"
-                    if backup_l3outs.get('ns'):
-                        suggestion = backup_l3outs['ns']
-                elif l3out_upper.startswith('DCI'):
-                    # C'est un L3Out DCI - vérifier OL ou UL par le tenant associé
-                    if '-OL-' in l3out_upper or tenant_context == " (Overlay)":
-                        l3out_type = "DCI-OL"
-                        if backup_l3outs.get('dci_ol'):
-                            suggestion = backup_l3outs['dci_ol']
-                    else:
-                        l3out_type = "DCI-UL"
-                        if backup_l3outs.get('dci_ul'):
-                            suggestion = backup_l3outs['dci_ul']
+            # Suggestion depuis le backup (par défaut: garder la même valeur)
+            suggestion = l3out
+            if l3out_type and backup_l3outs.get(backup_keys[l3out_type]):
+                suggestion = backup_l3outs[backup_keys[l3out_type]]
 
             # Affichage amélioré avec type détecté
             type_info = f" [{l3out_type}]" if l3out_type else ""
@@ -1214,20 +1673,13 @@ class FabricConverter:
             print(f"      → Suggestion Backup: {suggestion}")
 
             # Afficher les BDs qui utilisent ce L3Out
-            bd_col = None
-            for col_name in ['bd', 'bridge_domain']:
-                if col_name in columns_lower:
-                    idx = columns_lower.index(col_name)
-                    bd_col = df.columns[idx]
-                    break
-
-            if bd_col:
-                bd_list = matching_rows[bd_col].tolist()
-                tenant_list = matching_rows['tenant'].tolist() if 'tenant' in columns_lower else []
-                if bd_list:
-                    print(f"      BDs: {', '.join(str(b) for b in bd_list[:3])}", end="")
-                    if len(bd_list) > 3:
-                        print(f" ... (+{len(bd_list) - 3})")
+            if bd_values is not None:
+                # BDs distinctes (dédoublonnage en C, ordre d'apparition conservé)
+                bd_unique = pd.unique(bd_values[rows])
+                if bd_unique.size:
+                    print(f"      BDs: {', '.join(map(str, bd_unique[:3]))}", end="")
+                    if bd_unique.size > 3:
+                        print(f" ... (+{bd_unique.size - 3})")
                     else:
                         print()
 
@@ -1257,9 +1709,13 @@ class FabricConverter:
             print(f"🖥️  NODE IDs")
             print(f"{'─' * 60}")
 
+            items = []
             for node_id, contexts in sorted(remaining_node_ids.items()):
                 self.display_value_context_improved(node_id, contexts)
-                dest = self.prompt_mapping("Node ID", node_id, node_id)
+                items.append((node_id, node_id))
+
+            answers = self.prompt_mapping_batch("Node ID", items)
+            for (node_id, _), dest in zip(items, answers):
                 self.node_id_mapping[node_id] = dest
         elif self.node_id_mapping:
             print(f"\n   ✅ Tous les Node IDs déjà mappés automatiquement ({len(self.node_id_mapping)})")
@@ -1272,9 +1728,13 @@ class FabricConverter:
             print(f"📋 NODE PROFILES")
             print(f"{'─' * 60}")
 
+            items = []
             for np, contexts in sorted(remaining_node_profiles.items()):
                 self.display_value_context_improved(np, contexts)
-                dest = self.prompt_mapping("Node Profile", np, np)
+                items.append((np, np))
+
+            answers = self.prompt_mapping_batch("Node Profile", items)
+            for (np, _), dest in zip(items, answers):
                 self.node_profile_mapping[np] = dest
         elif self.node_profile_mapping:
             print(f"\n   ✅ Tous les Node Profiles déjà mappés automatiquement ({len(self.node_profile_mapping)})")
@@ -1288,9 +1748,13 @@ class FabricConverter:
             print(f"🔌 INTERFACE PROFILES")
             print(f"{'─' * 60}")
 
+            items = []
             for ip, contexts in sorted(remaining_int_profiles.items()):
                 self.display_value_context_improved(ip, contexts)
-                dest = self.prompt_mapping("Interface Profile", ip, ip)
+                items.append((ip, ip))
+
+            answers = self.prompt_mapping_batch("Interface Profile", items)
+            for (ip, _), dest in zip(items, answers):
                 self.int_profile_mapping[ip] = dest
 
         # Path EPs
@@ -1300,9 +1764,13 @@ class FabricConverter:
             print(f"🛤️  PATH EPs")
             print(f"{'─' * 60}")
 
+            items = []
             for path, contexts in sorted(path_eps.items()):
                 self.display_value_context_improved(path, contexts)
-                dest = self.prompt_mapping("Path EP", path, path)
+                items.append((path, path))
+
+            answers = self.prompt_mapping_batch("Path EP", items)
+            for (path, _), dest in zip(items, answers):
                 self.path_ep_mapping[path] = dest
 
         # Local AS
@@ -1312,9 +1780,13 @@ class FabricConverter:
             print(f"🔢 LOCAL AS")
             print(f"{'─' * 60}")
 
+            items = []
             for las, contexts in sorted(local_as_values.items()):
                 self.display_value_context_improved(las, contexts)
-                dest = self.prompt_mapping("Local AS", las, las)
+                items.append((las, las))
+
+            answers = self.prompt_mapping_batch("Local AS", items)
+            for (las, _), dest in zip(items, answers):
                 self.local_as_mapping[las] = dest
 
     def collect_route_control_mappings(self):
@@ -1334,6 +1806,7 @@ class FabricConverter:
             print(f"📏 MATCH RULES")
             print(f"{'─' * 60}")
 
+            items = []
             for mr, contexts in sorted(match_rules.items()):
                 self.display_value_context_improved(mr, contexts)
 
@@ -1342,7 +1815,10 @@ class FabricConverter:
                 if self.site_identifier_old and self.site_identifier_new:
                     default_val = replace_site_identifier(mr, self.site_identifier_old, self.site_identifier_new)
 
-                dest = self.prompt_mapping("Match Rule", mr, default_val)
+                items.append((mr, default_val))
+
+            answers = self.prompt_mapping_batch("Match Rule", items)
+            for (mr, _), dest in zip(items, answers):
                 self.match_rule_mapping[mr] = dest
 
         # Route Control Profiles
@@ -1352,6 +1828,7 @@ class FabricConverter:
             print(f"📋 ROUTE CONTROL PROFILES")
             print(f"{'─' * 60}")
 
+            items = []
             for rcp, contexts in sorted(rc_profiles.items()):
                 self.display_value_context_improved(rcp, contexts)
 
@@ -1360,7 +1837,10 @@ class FabricConverter:
                 if self.site_identifier_old and self.site_identifier_new:
                     default_val = replace_site_identifier(rcp, self.site_identifier_old, self.site_identifier_new)
 
-                dest = self.prompt_mapping("Route Control Profile", rcp, default_val)
+                items.append((rcp, default_val))
+
+            answers = self.prompt_mapping_batch("Route Control Profile", items)
+            for (rcp, _), dest in zip(items, answers):
                 self.route_control_profile_mapping[rcp] = dest
 
         # Route Control Contexts
@@ -1370,6 +1850,7 @@ class FabricConverter:
             print(f"🔀 ROUTE CONTROL CONTEXTS")
             print(f"{'─' * 60}")
 
+            items = []
             for rcc, contexts in sorted(rc_contexts.items()):
                 self.display_value_context_improved(rcc, contexts)
 
@@ -1378,9 +1859,122 @@ class FabricConverter:
                 if self.site_identifier_old and self.site_identifier_new:
                     default_val = replace_site_identifier(rcc, self.site_identifier_old, self.site_identifier_new)
 
-                dest = self.prompt_mapping("Route Control Context", rcc, default_val)
+                items.append((rcc, default_val))
+
+            answers = self.prompt_mapping_batch("Route Control Context", items)
+            for (rcc, _), dest in zip(items, answers):
                 self.route_control_context_mapping[rcc] = dest
 
+    def _int_mapping(self, mapping, strip=False):
+        """
+        Prépare un mapping à clés texte (node_id, local_as): sources normalisées
+        en str (strip optionnel), destinations converties en int si possible.
+        """
+        result = {}
+        for src, dest in mapping.items():
+            if src == dest:
+                continue
+            try:
+                dest = int(dest)
+            except ValueError:
+                pass
+            key = str(src).strip() if strip else src
+            result.setdefault(key, dest)
+        return result
+
+    def _finalize_mappings(self):
+        """
+        Convertit une fois pour toutes les mappings collectés en pd.Series
+        (paires identité retirées, familles vides écartées), réutilisées pour
+        tous les onglets par apply_conversions.
+        """
+        def as_series(mapping):
+            return pd.Series(list(mapping.values()), index=pd.Index(list(mapping), dtype=object), dtype=object)
+
+        families = {
+            'tenant': self.tenant_mapping,
+            'vrf': self.vrf_mapping,
+            'ap': self.ap_mapping,
+            'node_profile': self.node_profile_mapping,
+            'int_profile': self.int_profile_mapping,
+            'match_rule': self.match_rule_mapping,
+            'route_control_profile': self.route_control_profile_mapping,
+            'route_control_context': self.route_control_context_mapping,
+            'l3out': self.l3out_mapping,
+            'path_ep': self.path_ep_mapping,
+        }
+        self._map_series = {}
+        for family, mapping in families.items():
+            effective = {src: dest for src, dest in mapping.items() if src != dest}
+            if effective:
+                self._map_series[family] = as_series(effective)
+
+        # Mappings à clés texte (destinations converties en int si possible)
+        node_id_map = self._int_mapping(self.node_id_mapping, strip=True)
+        if node_id_map:
+            self._map_series['node_id'] = as_series(node_id_map)
+        local_as_map = self._int_mapping(self.local_as_mapping)
+        if local_as_map:
+            self._map_series['local_as'] = as_series(local_as_map)
+
+        return self._map_series
+
+    def _apply_map(self, df, real_col, mapping, keys=None):
+        """
+        Applique un mapping {source: destination} sur une colonne en une passe:
+        un lookup hash par cellule au lieu d'un scan de la colonne par paire.
+
+        mapping: dict, ou pd.Series déjà filtrée (voir _finalize_mappings)
+        keys: Series comparée aux sources (défaut: la colonne elle-même)
+        Retourne le nombre de cellules modifiées.
+        """
+        if isinstance(mapping, dict):
+            mapping = {src: dest for src, dest in mapping.items() if src != dest}
+            mapping = pd.Series(list(mapping.values()), index=pd.Index(list(mapping), dtype=object), dtype=object)
+        if mapping.empty:
+            return 0
+
+        if keys is None:
+            # Colonne catégorielle: on ne réécrit que les catégories, pas chaque cellule
+            if isinstance(df[real_col].dtype, pd.CategoricalDtype):
+                return self._rename_categories(df, real_col, mapping)
+            keys = df[real_col]
+
+        mask = keys.isin(mapping.index)
+        count = int(mask.sum())
+        if count > 0:
+            new_values = keys[mask].astype(object).map(mapping).infer_objects()
+            self._add_categories(df, real_col, pd.unique(new_values))
+            df.loc[mask, real_col] = new_values
+
+        return count
+
+    def _rename_categories(self, df, real_col, mapping):
+        """
+        Applique un mapping (pd.Series source → destination) sur une colonne
+        catégorielle via ses catégories: O(valeurs uniques) pour le renommage,
+        les codes entiers des lignes sont simplement réindexés. Plusieurs
+        sources peuvent pointer vers la même destination. Retourne le nombre
+        de cellules modifiées.
+        """
+        col = df[real_col]
+        categories = col.cat.categories
+        changed = categories.isin(mapping.index)
+        codes = col.cat.codes.to_numpy()
+        valid = codes >= 0
+        count = int(changed[codes[valid]].sum())
+        if count == 0:
+            return 0
+
+        # Catégories renommées, fusionnées si deux sources ont la même destination
+        renamed = np.asarray(categories, dtype=object).copy()
+        renamed[changed] = mapping.reindex(categories[changed]).to_numpy()
+        remap, new_categories = pd.factorize(pd.Index(renamed, dtype=object))
+        new_codes = np.where(valid, remap[codes], -1)
+        df[real_col] = pd.Series(pd.Categorical.from_codes(new_codes, categories=new_categories),
+                                 index=col.index, name=col.name)
+        return count
+
     def apply_conversions(self):
         """Applique les conversions à tous les onglets"""
         print("\n" + "=" * 60)
@@ -1389,179 +1983,86 @@ class FabricConverter:
 
         total_changes = 0
 
+        # Mappings convertis une seule fois en pd.Series (familles vides écartées)
+        map_series = self._finalize_mappings()
+
+        # Familles texte appliquées telles quelles (tous les onglets)
+        text_families = [
+            ('tenant', self.tenant_columns),
+            ('vrf', self.vrf_columns),
+            ('ap', self.ap_columns),
+            ('node_profile', self.node_profile_columns),
+            ('int_profile', self.int_profile_columns),
+            ('match_rule', self.match_rule_columns),
+            ('route_control_profile', self.route_control_profile_columns),
+            ('route_control_context', self.route_control_context_columns),
+        ]
+        text_families = [(family, columns) for family, columns in text_families if family in map_series]
+
+        # Mapping fusionné par combinaison de familles, partagé entre onglets
+        combined_series = {}
+
         for sheet_name, df in self.excel_data.items():
             sheet_changes = 0
-            columns = [str(c).lower() for c in df.columns]
+            col_index = self._get_col_index(sheet_name)
 
-            # Conversion Tenants
-            for col in self.tenant_columns:
-                if col in columns:
-                    idx = columns.index(col)
-                    real_col = df.columns[idx]
-                    for src, dest in self.tenant_mapping.items():
-                        if src != dest:
-                            mask = df[real_col] == src
-                            count = mask.sum()
-                            if count > 0:
-                                df.loc[mask, real_col] = dest
-                                sheet_changes += count
-
-            # Conversion VRFs
-            for col in self.vrf_columns:
-                if col in columns:
-                    idx = columns.index(col)
-                    real_col = df.columns[idx]
-                    for src, dest in self.vrf_mapping.items():
-                        if src != dest:
-                            mask = df[real_col] == src
-                            count = mask.sum()
-                            if count > 0:
-                                df.loc[mask, real_col] = dest
-                                sheet_changes += count
-
-            # Conversion APs
-            for col in self.ap_columns:
-                if col in columns:
-                    idx = columns.index(col)
-                    real_col = df.columns[idx]
-                    for src, dest in self.ap_mapping.items():
-                        if src != dest:
-                            mask = df[real_col] == src
-                            count = mask.sum()
-                            if count > 0:
-                                df.loc[mask, real_col] = dest
-                                sheet_changes += count
+            sheet_families = list(text_families)
 
             # Conversion L3Out (pour bd_to_l3out)
-            if sheet_name == 'bd_to_l3out':
-                for col_name in ['l3out', 'l3out_name']:
-                    if col_name in columns:
-                        idx = columns.index(col_name)
-                        real_col = df.columns[idx]
-                        for src, dest in self.l3out_mapping.items():
-                            if src != dest:
-                                mask = df[real_col] == src
-                                count = mask.sum()
-                                if count > 0:
-                                    df.loc[mask, real_col] = dest
-                                    sheet_changes += count
-
-            # Conversion Node IDs (tous les onglets)
-            for col in self.node_id_columns:
-                if col in columns:
-                    idx = columns.index(col)
-                    real_col = df.columns[idx]
-                    for src, dest in self.node_id_mapping.items():
-                        if src != dest:
-                            mask = df[real_col].astype(str).str.strip() == str(src).strip()
-                            count = mask.sum()
-                            if count > 0:
-                                try:
-                                    df.loc[mask, real_col] = int(dest)
-                                except ValueError:
-                                    df.loc[mask, real_col] = dest
-                                sheet_changes += count
-
-            # Conversion Node Profiles (tous les onglets)
-            for col in self.node_profile_columns:
-                if col in columns:
-                    idx = columns.index(col)
-                    real_col = df.columns[idx]
-                    for src, dest in self.node_profile_mapping.items():
-                        if src != dest:
-                            mask = df[real_col] == src
-                            count = mask.sum()
-                            if count > 0:
-                                df.loc[mask, real_col] = dest
-                                sheet_changes += count
-
-            # Conversion Interface Profiles (tous les onglets)
-            for col in self.int_profile_columns:
-                if col in columns:
-                    idx = columns.index(col)
-                    real_col = df.columns[idx]
-                    for src, dest in self.int_profile_mapping.items():
-                        if src != dest:
-                            mask = df[real_col] == src
-                            count = mask.sum()
-                            if count > 0:
-                                df.loc[mask, real_col] = dest
-                                sheet_changes += count
+            if sheet_name == 'bd_to_l3out' and 'l3out' in map_series:
+                sheet_families.append(('l3out', ['l3out', 'l3out_name']))
 
             # Conversion Path EPs (tous les onglets SAUF interface_config)
             # BUG FIX: 'interface' est dans path_ep_columns mais aussi colonne de interface_config
-            if sheet_name != 'interface_config':
-                for col in self.path_ep_columns:
-                    if col in columns:
-                        idx = columns.index(col)
-                        real_col = df.columns[idx]
-                        for src, dest in self.path_ep_mapping.items():
-                            if src != dest:
-                                mask = df[real_col] == src
-                                count = mask.sum()
-                                if count > 0:
-                                    df.loc[mask, real_col] = dest
-                                    sheet_changes += count
+            if sheet_name != 'interface_config' and 'path_ep' in map_series:
+                sheet_families.append(('path_ep', self.path_ep_columns))
+
+            # Fusionner les mappings par colonne réelle: une seule passe par colonne.
+            # Pas de DataFrame.replace({col: {src: dest}}): il teste chaque paire
+            # par un masque sur la colonne (O(paires × lignes)), convertit les
+            # colonnes catégorielles et ne donne pas le nombre de cellules modifiées.
+            families_by_col = {}
+            for family, columns in sheet_families:
+                for col in columns:
+                    real_col = col_index.get(col)
+                    if real_col is not None:
+                        families_by_col.setdefault(real_col, []).append(family)
+
+            for real_col, families in families_by_col.items():
+                key = tuple(families)
+                if key not in combined_series:
+                    if len(key) == 1:
+                        combined_series[key] = map_series[key[0]]
+                    else:
+                        # La dernière famille l'emporte en cas de source commune
+                        combined = pd.concat([map_series[f] for f in key])
+                        combined_series[key] = combined[~combined.index.duplicated(keep='last')]
+                sheet_changes += self._apply_map(df, real_col, combined_series[key])
+
+            # Conversion Node IDs (tous les onglets)
+            if 'node_id' in map_series:
+                for col in self.node_id_columns:
+                    real_col = col_index.get(col)
+                    if real_col is not None:
+                        # Comparaison sur la forme texte (101 == '101' == ' 101'), calculée une fois
+                        keys = df[real_col].astype(str).str.strip()
+                        sheet_changes += self._apply_map(df, real_col, map_series['node_id'], keys=keys)
 
             # Conversion Local AS (tous les onglets)
-            for col in self.local_as_columns:
-                if col in columns:
-                    idx = columns.index(col)
-                    real_col = df.columns[idx]
-                    for src, dest in self.local_as_mapping.items():
-                        if src != dest:
-                            mask = df[real_col].astype(str) == src
-                            count = mask.sum()
-                            if count > 0:
-                                try:
-                                    df.loc[mask, real_col] = int(dest)
-                                except ValueError:
-                                    df.loc[mask, real_col] = dest
-                                sheet_changes += count
-
-            # Conversion Match Rules (tous les onglets)
-            for col in self.match_rule_columns:
-                if col in columns:
-                    idx = columns.index(col)
-                    real_col = df.columns[idx]
-                    for src, dest in self.match_rule_mapping.items():
-                        if src != dest:
-                            mask = df[real_col] == src
-                            count = mask.sum()
-                            if count > 0:
-                                df.loc[mask, real_col] = dest
-                                sheet_changes += count
-
-            # Conversion Route Control Profiles (tous les onglets)
-            for col in self.route_control_profile_columns:
-                if col in columns:
-                    idx = columns.index(col)
-                    real_col = df.columns[idx]
-                    for src, dest in self.route_control_profile_mapping.items():
-                        if src != dest:
-                            mask = df[real_col] == src
-                            count = mask.sum()
-                            if count > 0:
-                                df.loc[mask, real_col] = dest
-                                sheet_changes += count
-
-            # Conversion Route Control Contexts (tous les onglets)
-            for col in self.route_control_context_columns:
-                if col in columns:
-                    idx = columns.index(col)
-                    real_col = df.columns[idx]
-                    for src, dest in self.route_control_context_mapping.items():
-                        if src != dest:
-                            mask = df[real_col] == src
-                            count = mask.sum()
-                            if count > 0:
-                                df.loc[mask, real_col] = dest
-                                sheet_changes += count
+            if 'local_as' in map_series:
+                for col in self.local_as_columns:
+                    real_col = col_index.get(col)
+                    if real_col is not None:
+                        keys = df[real_col].astype(str)
+                        sheet_changes += self._apply_map(df, real_col, map_series['local_as'], keys=keys)
 
             if sheet_changes > 0:
                 print(f"   📝 {sheet_name}: {sheet_changes} modifications")
                 total_changes += sheet_changes
 
+        if total_changes > 0:
+            self._data_version += 1
+
         print(f"\n📊 Total: {total_changes} modifications appliquées")
         return total_changes
 
@@ -1569,12 +2070,72 @@ class FabricConverter:
         """Sauvegarde le fichier Excel converti"""
         print(f"\n💾 Sauvegarde du fichier: {self.output_excel}")
 
-        with pd.ExcelWriter(self.output_excel, engine='openpyxl') as writer:
-            for sheet_name, df in self.excel_data.items():
-                df.to_excel(writer, sheet_name=sheet_name, index=False)
+        # Un seul chemin d'écriture, ligne par ligne (openpyxl write_only)
+        self._write_sheets_write_only(self.output_excel, self._iter_trimmed_sheets())
 
         print(f"✅ Fichier sauvegardé: {self.output_excel}")
 
+    def _iter_trimmed_sheets(self):
+        """
+        Produit (onglet, DataFrame) un onglet à la fois, sans les lignes vides
+        de fin: une seule vue d'onglet est préparée à la fois pour l'écriture.
+        """
+        for sheet_name, df in self.excel_data.items():
+            non_empty = np.flatnonzero(df.notna().any(axis=1).to_numpy())
+            last_row = non_empty[-1] + 1 if len(non_empty) else 0
+            yield sheet_name, df.iloc[:last_row]
+
+    def _write_sheets_write_only(self, path, sheets, chunk_size=5000):
+        """
+        Écrit des paires (onglet, DataFrame) avec un classeur openpyxl write_only:
+        les lignes sont sérialisées au fil de l'eau, sans arbre de cellules en
+        mémoire. La conversion en objets Python se fait par blocs de chunk_size
+        lignes, jamais sur l'onglet entier. En-têtes au style de
+        DataFrame.to_excel avant pandas 3: valeur brute, gras, bordure fine,
+        centrés (pandas 3 n'applique plus de style aux en-têtes). Colonnes
+        datetime au format de date de to_excel.
+        """
+        from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import Alignment, Border, Font, Side
+
+        wb = Workbook(write_only=True)
+        header_font = Font(bold=True)
+        thin = Side(style='thin')
+        header_border = Border(left=thin, right=thin, top=thin, bottom=thin)
+        header_alignment = Alignment(horizontal='center', vertical='top')
+
+        for sheet_name, df in sheets:
+            ws = wb.create_sheet(title=sheet_name)
+
+            header = []
+            for col in df.columns:
+                cell = WriteOnlyCell(ws, value=col)
+                cell.font = header_font
+                cell.border = header_border
+                cell.alignment = header_alignment
+                header.append(cell)
+            ws.append(header)
+
+            date_positions = [i for i, dtype in enumerate(df.dtypes)
+                              if pd.api.types.is_datetime64_any_dtype(dtype)]
+
+            # Valeurs Python natives, NaN → '' (na_rep par défaut de to_excel)
+            for start in range(0, len(df), chunk_size):
+                block = df.iloc[start:start + chunk_size]
+                values = block.astype(object).where(block.notna(), '')
+                for row in values.itertuples(index=False, name=None):
+                    if date_positions:
+                        row = list(row)
+                        for i in date_positions:
+                            if row[i] != '':
+                                cell = WriteOnlyCell(ws, value=row[i])
+                                cell.number_format = 'YYYY-MM-DD HH:MM:SS'
+                                row[i] = cell
+                    ws.append(row)
+
+        wb.save(path)
+
     def show_summary(self):
         """Affiche un résumé des mappings configurés"""
         print("\n" + "=" * 60)
@@ -1585,8 +2146,7 @@ class FabricConverter:
             changes = {k: v for k, v in mapping.items() if k != v}
             if changes:
                 print(f"{indent}{title}:")
-                for src, dest in changes.items():
-                    print(f"{indent}   {src} → {dest}")
+                sys.stdout.write(''.join(f"{indent}   {src} → {dest}\n" for src, dest in changes.items()))
                 return True
             return False
 
@@ -1683,19 +2243,10 @@ class FabricConverter:
             return
 
         vlan_pool_df = self.excel_data['vlan_pool']
-        columns_lower = [str(c).lower() for c in vlan_pool_df.columns]
 
         # Trouver les colonnes pool et description
-        pool_col = None
-        desc_col = None
-        for col in ['pool', 'pool_name', 'name', 'vlan_pool']:
-            if col in columns_lower:
-                pool_col = vlan_pool_df.columns[columns_lower.index(col)]
-                break
-        for col in ['description', 'descr', 'desc']:
-            if col in columns_lower:
-                desc_col = vlan_pool_df.columns[columns_lower.index(col)]
-                break
+        pool_col = self._find_col('vlan_pool', ['pool', 'pool_name', 'name', 'vlan_pool'])
+        desc_col = self._find_col('vlan_pool', ['description', 'descr', 'desc'])
 
         if not pool_col:
             print("   ⚠️  Colonne 'pool' non trouvée dans vlan_pool")
@@ -1708,35 +2259,31 @@ class FabricConverter:
         print("VLAN Pools détectés - Validez ou modifiez chaque description")
         print("-" * 60)
 
-        import re
         generated_descriptions = {}
 
-        for idx, row in vlan_pool_df.iterrows():
-            pool_name = str(row[pool_col]).strip()
-            if not pool_name or pool_name == 'nan':
-                continue
-
-            # Extraire le premier mot avant - ou _
-            match = re.match(r'^([^-_]+)', pool_name)
-            server_name = match.group(1) if match else pool_name
-
-            # Déterminer le type basé sur P1/P2/P3/P4/L3O
-            pool_upper = pool_name.upper()
-            has_p1_p2 = 'P1' in pool_upper or 'P2' in pool_upper
-            has_p3_p4 = 'P3' in pool_upper or 'P4' in pool_upper
-            has_l3o = 'L3O' in pool_upper
-
-            # Générer la description
-            if has_p3_p4 and has_l3o:
-                auto_desc = f"{server_name}_L3OUT"
-            elif has_p3_p4:
-                auto_desc = f"{server_name}_VTEP"
-            elif has_p1_p2:
-                auto_desc = f"{server_name}_SEGMENTS_VLAN"
-            else:
-                auto_desc = ""  # Pas de règle applicable
-
-            if auto_desc:
+        # Classification vectorisée de tous les pools (une passe regex par colonne)
+        pool_names = vlan_pool_df[pool_col].astype(str).str.strip()
+        pool_names = pool_names[pool_names.notna() & (pool_names != '') & (pool_names != 'nan')]
+
+        # Extraire le premier mot avant - ou _
+        server_names = pool_names.str.extract(_POOL_SERVER_RE, expand=False).fillna(pool_names)
+
+        # Déterminer le type basé sur P1/P2/P3/P4/L3O
+        pool_upper = pool_names.str.upper()
+        has_p1_p2 = pool_upper.str.contains(_POOL_P1_P2_RE).to_numpy(dtype=bool)
+        has_p3_p4 = pool_upper.str.contains(_POOL_P3_P4_RE).to_numpy(dtype=bool)
+        has_l3o = pool_upper.str.contains('L3O', regex=False).to_numpy(dtype=bool)
+
+        # Suffixe de description ('' = pas de règle applicable)
+        suffixes = np.select(
+            [has_p3_p4 & has_l3o, has_p3_p4, has_p1_p2],
+            ['_L3OUT', '_VTEP', '_SEGMENTS_VLAN'],
+            default=''
+        )
+
+        for pool_name, server_name, suffix in zip(pool_names, server_names, suffixes):
+            if suffix:
+                auto_desc = f"{server_name}{suffix}"
                 print(f"\n   Pool: {pool_name}")
                 print(f"   Description auto: {auto_desc}")
                 print(f"   → Confirmer ou modifier [{auto_desc}]: ", end="", flush=True)
@@ -1761,28 +2308,20 @@ class FabricConverter:
             return 0
 
         vlan_pool_df = self.excel_data['vlan_pool']
-        columns_lower = [str(c).lower() for c in vlan_pool_df.columns]
 
-        pool_col = None
-        desc_col = None
-        for col in ['pool', 'pool_name', 'name', 'vlan_pool']:
-            if col in columns_lower:
-                pool_col = vlan_pool_df.columns[columns_lower.index(col)]
-                break
-        for col in ['description', 'descr', 'desc']:
-            if col in columns_lower:
-                desc_col = vlan_pool_df.columns[columns_lower.index(col)]
-                break
+        pool_col = self._find_col('vlan_pool', ['pool', 'pool_name', 'name', 'vlan_pool'])
+        desc_col = self._find_col('vlan_pool', ['description', 'descr', 'desc'])
 
         if not pool_col or not desc_col:
             return 0
 
+        # Une seule passe (hash) sur la colonne pool au lieu d'un masque par pool
+        mapped = vlan_pool_df[pool_col].map(self.vlan_pool_descriptions)
+        mask = mapped.notna()
         count = 0
-        for pool_name, description in self.vlan_pool_descriptions.items():
-            mask = vlan_pool_df[pool_col] == pool_name
-            if mask.any():
-                vlan_pool_df.loc[mask, desc_col] = description
-                count += 1
+        if mask.any():
+            vlan_pool_df.loc[mask, desc_col] = mapped[mask].to_numpy(dtype=object)
+            count = vlan_pool_df.loc[mask, pool_col].nunique()
 
         if count > 0:
             print(f"   ✅ {count} description(s) VLAN Pool appliquée(s)")
@@ -1800,58 +2339,38 @@ class FabricConverter:
             return
 
         encap_df = self.excel_data['vlan_pool_encap_block']
-        columns_lower = [str(c).lower() for c in encap_df.columns]
 
         # Trouver les colonnes
-        start_col = None
-        end_col = None
-        pool_col = None
-        mode_col = None
-        desc_col = None
-
-        for col in ['block_start', 'start', 'from']:
-            if col in columns_lower:
-                start_col = encap_df.columns[columns_lower.index(col)]
-                break
-        for col in ['block_end', 'end', 'to']:
-            if col in columns_lower:
-                end_col = encap_df.columns[columns_lower.index(col)]
-                break
-        for col in ['pool', 'pool_name', 'vlan_pool']:
-            if col in columns_lower:
-                pool_col = encap_df.columns[columns_lower.index(col)]
-                break
-        for col in ['pool_allocation_mode', 'allocation_mode', 'mode']:
-            if col in columns_lower:
-                mode_col = encap_df.columns[columns_lower.index(col)]
-                break
-        for col in ['description', 'descr', 'desc']:
-            if col in columns_lower:
-                desc_col = encap_df.columns[columns_lower.index(col)]
-                break
+        start_col = self._find_col('vlan_pool_encap_block', ['block_start', 'start', 'from'])
+        end_col = self._find_col('vlan_pool_encap_block', ['block_end', 'end', 'to'])
+        pool_col = self._find_col('vlan_pool_encap_block', ['pool', 'pool_name', 'vlan_pool'])
+        mode_col = self._find_col('vlan_pool_encap_block', ['pool_allocation_mode', 'allocation_mode', 'mode'])
+        desc_col = self._find_col('vlan_pool_encap_block', ['description', 'descr', 'desc'])
 
         if not start_col or not end_col:
             print("   ⚠️  Colonnes block_start/block_end non trouvées")
             return
 
+        # Bornes numériques (valeurs non numériques ignorées), calculées en colonne
+        starts = pd.to_numeric(encap_df[start_col], errors='coerce')
+        ends = pd.to_numeric(encap_df[end_col], errors='coerce')
+        valid = (starts.notna() & ends.notna()).to_numpy()
+        starts = np.trunc(starts.to_numpy(dtype=float, na_value=0)).astype(np.int64)
+        ends = np.trunc(ends.to_numpy(dtype=float, na_value=0)).astype(np.int64)
+
         # Détecter les ranges (block_start != block_end)
-        ranges_found = []
-        for idx, row in encap_df.iterrows():
-            try:
-                start = int(row[start_col])
-                end = int(row[end_col])
-                if start != end:
-                    pool_name = row[pool_col] if pool_col else 'Unknown'
-                    vlan_count = end - start + 1
-                    ranges_found.append({
-                        'idx': idx,
-                        'pool': pool_name,
-                        'start': start,
-                        'end': end,
-                        'count': vlan_count
-                    })
-            except (ValueError, TypeError):
-                continue
+        is_range = valid & (starts != ends)
+        pools = encap_df[pool_col].to_numpy() if pool_col else None
+        ranges_found = [
+            {
+                'idx': encap_df.index[i],
+                'pool': pools[i] if pools is not None else 'Unknown',
+                'start': int(starts[i]),
+                'end': int(ends[i]),
+                'count': int(ends[i] - starts[i] + 1)
+            }
+            for i in np.flatnonzero(is_range)
+        ]
 
         if not ranges_found:
             print("   ℹ️  Aucun range détecté - tous les encap blocks sont déjà individuels")
@@ -1875,30 +2394,25 @@ class FabricConverter:
 
         # Créer les nouvelles lignes
         print(f"\n🔄 Split en cours...")
-        new_rows = []
-
-        for idx, row in encap_df.iterrows():
-            try:
-                start = int(row[start_col])
-                end = int(row[end_col])
-            except (ValueError, TypeError):
-                new_rows.append(row.to_dict())
-                continue
-
-            if start == end:
-                # Pas un range, garder tel quel
-                new_rows.append(row.to_dict())
+        # Chaque ligne est répétée (end - start + 1) fois si c'est un range, 1 fois sinon
+        counts = np.where(is_range, np.maximum(ends - starts + 1, 0), 1)
+        new_df = encap_df.iloc[np.repeat(np.arange(len(encap_df)), counts)].reset_index(drop=True)
+
+        # VLAN individuel = start + position de la ligne dans son range
+        split = np.repeat(is_range, counts)
+        offsets = np.arange(len(new_df)) - np.repeat(np.cumsum(counts) - counts, counts)
+        vlans = np.repeat(starts, counts) + offsets
+        for col in (start_col, end_col):
+            if pd.api.types.is_numeric_dtype(new_df[col].dtype):
+                values = new_df[col].to_numpy(copy=True)
             else:
-                # Splitter le range
-                for vlan in range(start, end + 1):
-                    new_row = row.to_dict()
-                    new_row[start_col] = vlan
-                    new_row[end_col] = vlan
-                    new_rows.append(new_row)
+                values = new_df[col].to_numpy(dtype=object, copy=True)
+            values[split] = vlans[split]
+            new_df[col] = values
 
         # Remplacer le DataFrame
-        new_df = pd.DataFrame(new_rows)
         self.excel_data['vlan_pool_encap_block'] = new_df
+        self._data_version += 1
 
         print(f"   ✅ {len(ranges_found)} range(s) splittés en {len(new_df)} lignes individuelles")
         print(f"   📝 Vous pourrez maintenant appliquer des descriptions par VLAN")
@@ -1922,15 +2436,7 @@ class FabricConverter:
         print("-" * 60)
         print("Collez vos lignes puis appuyez sur Entrée (ligne vide pour terminer):\n")
 
-        lines = []
-        while True:
-            try:
-                line = input()
-                if not line.strip():
-                    break
-                lines.append(line.strip())
-            except EOFError:
-                break
+        lines = self.read_pasted_lines()
 
         if not lines:
             print("   ℹ️  Aucune ligne fournie")
@@ -1939,25 +2445,22 @@ class FabricConverter:
         # Parser les lignes
         print(f"\n🔍 Analyse de {len(lines)} ligne(s)...")
 
+        # Validation en une regex; seules les lignes rejetées sont redécoupées
+        # pour expliquer le motif du rejet
         for line in lines:
-            if ',' not in line:
-                print(f"   ⚠️  Ligne ignorée (pas de virgule): {line[:50]}...")
-                continue
-
-            parts = line.split(',', 1)  # Split sur la première virgule seulement
-            vlan_str = parts[0].strip()
-            description = parts[1].strip() if len(parts) > 1 else ''
-
-            try:
-                vlan = int(vlan_str)
-            except ValueError:
-                print(f"   ⚠️  VLAN invalide: {vlan_str}")
-                continue
-
-            if not description:
-                print(f"   ⚠️  Description vide pour VLAN {vlan}")
+            match = _VLAN_LINE_RE.fullmatch(line)
+            if match is None:
+                vlan_str, comma, _ = line.partition(',')
+                vlan_str = vlan_str.strip()
+                if not comma:
+                    print(f"   ⚠️  Ligne ignorée (pas de virgule): {line[:50]}...")
+                elif not _INT_RE.fullmatch(vlan_str):
+                    print(f"   ⚠️  VLAN invalide: {vlan_str}")
+                else:
+                    print(f"   ⚠️  Description vide pour VLAN {int(vlan_str)}")
                 continue
 
+            vlan, description = int(match.group(1)), match.group(2)
             self.vlan_descriptions.append((vlan, description))
             print(f"   ✅ VLAN {vlan}: {description[:50]}{'...' if len(description) > 50 else ''}")
 
@@ -1980,33 +2483,60 @@ class FabricConverter:
             return 0
 
         vlan_df = self.excel_data['vlan_pool_encap_block']
-        vlan_columns = [str(c).lower() for c in vlan_df.columns]
 
         # Trouver les colonnes block_start et block_end
-        start_col = None
-        end_col = None
-        desc_col = None
-
-        for col in ['block_start', 'from', 'start']:
-            if col in vlan_columns:
-                start_col = vlan_df.columns[vlan_columns.index(col)]
-                break
-
-        for col in ['block_end', 'to', 'end']:
-            if col in vlan_columns:
-                end_col = vlan_df.columns[vlan_columns.index(col)]
-                break
-
-        for col in ['description', 'descr']:
-            if col in vlan_columns:
-                desc_col = vlan_df.columns[vlan_columns.index(col)]
-                break
+        start_col = self._find_col('vlan_pool_encap_block', ['block_start', 'from', 'start'])
+        end_col = self._find_col('vlan_pool_encap_block', ['block_end', 'to', 'end'])
+        desc_col = self._find_col('vlan_pool_encap_block', ['description', 'descr'])
 
         if not start_col or not end_col:
             print("   ⚠️  Colonnes block_start/block_end non trouvées")
             return 0
 
-        for vlan, description in self.vlan_descriptions:
+        # Index d'intervalles [start, end] construit une fois (lignes à bornes numériques)
+        starts = pd.to_numeric(vlan_df[start_col], errors='coerce')
+        ends = pd.to_numeric(vlan_df[end_col], errors='coerce')
+        starts = np.trunc(starts.to_numpy(dtype=float, na_value=np.nan))
+        ends = np.trunc(ends.to_numpy(dtype=float, na_value=np.nan))
+        # Plages inversées (start > end) exclues: elles ne contiennent aucun VLAN
+        valid = ~np.isnan(starts) & ~np.isnan(ends) & (starts <= ends)
+        iv_positions = np.flatnonzero(valid)
+        vlan_ranges = pd.IntervalIndex.from_arrays(
+            starts[valid].astype(np.int64), ends[valid].astype(np.int64), closed='both'
+        )
+        overlapping = vlan_ranges.is_overlapping
+        valid_starts, valid_ends = starts[valid], ends[valid]
+
+        # Onglets bd / epg / bd_subnet: colonnes et noms présents résolus une fois;
+        # les descriptions sont accumulées par nom puis écrites en une passe par onglet
+        desc_targets = []
+        for sheet, name_candidates, suffix in [
+            ('bd', ['bd', 'name', 'bridge_domain'], '-BD'),
+            ('epg', ['epg', 'name'], '-EPG'),
+            ('bd_subnet', ['bd', 'bridge_domain'], '-BD'),
+        ]:
+            if sheet not in self.excel_data:
+                continue
+            name_col = self._find_col(sheet, name_candidates)
+            sheet_desc_col = self._find_col(sheet, ['description', 'descr'])
+            if name_col and sheet_desc_col:
+                desc_targets.append({
+                    'sheet': sheet,
+                    'name_col': name_col,
+                    'desc_col': sheet_desc_col,
+                    'suffix': suffix,
+                    'names': set(self.excel_data[sheet][name_col].dropna()),
+                    'updates': {}
+                })
+
+        # Plage de chaque VLAN résolue en un seul appel (plages disjointes)
+        if not overlapping:
+            range_positions = vlan_ranges.get_indexer([vlan for vlan, _ in self.vlan_descriptions])
+
+        # Écritures vlan_pool_encap_block accumulées (position de ligne → description)
+        pending_writes = {}
+
+        for i, (vlan, description) in enumerate(self.vlan_descriptions):
             print(f"\n   🔍 Traitement VLAN {vlan}...")
 
             # Extraire le numéro de circuit (tout avant le premier _)
@@ -2017,99 +2547,43 @@ class FabricConverter:
             print(f"      Circuit: {circuit} → BD: {bd_name}, EPG: {epg_name}")
 
             # 1. Vérifier si VLAN est dans une plage et modifier vlan_pool_encap_block
-            vlan_found = False
-            for idx, row in vlan_df.iterrows():
-                try:
-                    start = int(row[start_col])
-                    end = int(row[end_col])
-                    if start <= vlan <= end:
-                        vlan_found = True
-                        if desc_col:
-                            vlan_df.at[idx, desc_col] = description
-                            print(f"      ✅ vlan_pool_encap_block: description mise à jour")
-                            total_changes += 1
-                        break
-                except (ValueError, TypeError):
-                    continue
+            # Première ligne (ordre de l'onglet) dont la plage contient le VLAN
+            if overlapping:
+                in_range = (valid_starts <= vlan) & (vlan <= valid_ends)
+                pos = in_range.argmax() if in_range.any() else -1
+            else:
+                pos = range_positions[i]
+
+            vlan_found = pos >= 0
+            if vlan_found and desc_col:
+                pending_writes[iv_positions[pos]] = description
+                print(f"      ✅ vlan_pool_encap_block: description mise à jour")
+                total_changes += 1
 
             if not vlan_found:
                 print(f"      ⚠️  VLAN {vlan} non trouvé dans les plages")
                 continue
 
-            # 2. Modifier la description dans l'onglet bd
-            if 'bd' in self.excel_data:
-                bd_df = self.excel_data['bd']
-                bd_columns = [str(c).lower() for c in bd_df.columns]
-
-                bd_col_name = None
-                bd_desc_col = None
-
-                for col in ['bd', 'name', 'bridge_domain']:
-                    if col in bd_columns:
-                        bd_col_name = bd_df.columns[bd_columns.index(col)]
-                        break
-
-                for col in ['description', 'descr']:
-                    if col in bd_columns:
-                        bd_desc_col = bd_df.columns[bd_columns.index(col)]
-                        break
-
-                if bd_col_name and bd_desc_col:
-                    mask = bd_df[bd_col_name] == bd_name
-                    if mask.any():
-                        bd_df.loc[mask, bd_desc_col] = description
-                        print(f"      ✅ bd: description mise à jour pour {bd_name}")
-                        total_changes += 1
-
-            # 3. Modifier la description dans l'onglet epg
-            if 'epg' in self.excel_data:
-                epg_df = self.excel_data['epg']
-                epg_columns = [str(c).lower() for c in epg_df.columns]
-
-                epg_col_name = None
-                epg_desc_col = None
-
-                for col in ['epg', 'name']:
-                    if col in epg_columns:
-                        epg_col_name = epg_df.columns[epg_columns.index(col)]
-                        break
-
-                for col in ['description', 'descr']:
-                    if col in epg_columns:
-                        epg_desc_col = epg_df.columns[epg_columns.index(col)]
-                        break
-
-                if epg_col_name and epg_desc_col:
-                    mask = epg_df[epg_col_name] == epg_name
-                    if mask.any():
-                        epg_df.loc[mask, epg_desc_col] = description
-                        print(f"      ✅ epg: description mise à jour pour {epg_name}")
-                        total_changes += 1
-
-            # 4. Modifier la description dans l'onglet bd_subnet
-            if 'bd_subnet' in self.excel_data:
-                subnet_df = self.excel_data['bd_subnet']
-                subnet_columns = [str(c).lower() for c in subnet_df.columns]
-
-                subnet_bd_col = None
-                subnet_desc_col = None
-
-                for col in ['bd', 'bridge_domain']:
-                    if col in subnet_columns:
-                        subnet_bd_col = subnet_df.columns[subnet_columns.index(col)]
-                        break
-
-                for col in ['description', 'descr']:
-                    if col in subnet_columns:
-                        subnet_desc_col = subnet_df.columns[subnet_columns.index(col)]
-                        break
-
-                if subnet_bd_col and subnet_desc_col:
-                    mask = subnet_df[subnet_bd_col] == bd_name
-                    if mask.any():
-                        subnet_df.loc[mask, subnet_desc_col] = description
-                        print(f"      ✅ bd_subnet: description mise à jour pour {bd_name}")
-                        total_changes += 1
+            # 2-4. Descriptions dans les onglets bd, epg et bd_subnet
+            for target in desc_targets:
+                name = f"{circuit}{target['suffix']}"
+                if name in target['names']:
+                    target['updates'][name] = description
+                    print(f"      ✅ {target['sheet']}: description mise à jour pour {name}")
+                    total_changes += 1
+
+        # Une seule écriture .loc pour vlan_pool_encap_block (dernière description gagne)
+        if pending_writes:
+            rows = vlan_df.index[list(pending_writes)]
+            vlan_df.loc[rows, desc_col] = np.array(list(pending_writes.values()), dtype=object)
+
+        # Une seule passe (hash) par onglet: la dernière description d'un nom l'emporte
+        for target in desc_targets:
+            if target['updates']:
+                df = self.excel_data[target['sheet']]
+                new_desc = df[target['name_col']].map(target['updates'])
+                mask = new_desc.notna()
+                df.loc[mask, target['desc_col']] = new_desc[mask].to_numpy(dtype=object)
 
         print(f"\n📊 Total descriptions modifiées: {total_changes}")
         return total_changes
@@ -2124,13 +2598,8 @@ class FabricConverter:
             return 0
 
         bd_df = self.excel_data['bd']
-        columns = [str(c).lower() for c in bd_df.columns]
 
-        routing_col = None
-        for col in ['enable_routing', 'unicast_route', 'routing']:
-            if col in columns:
-                routing_col = bd_df.columns[columns.index(col)]
-                break
+        routing_col = self._find_col('bd', ['enable_routing', 'unicast_route', 'routing'])
 
         if not routing_col:
             print("   ⚠️  Colonne enable_routing non trouvée dans l'onglet bd")
@@ -2156,34 +2625,25 @@ class FabricConverter:
         routing_enable_file = str(excel_path.parent / f"BD-{excel_path.stem}-routing_enable.xlsx")
 
         bd_df = self.excel_data['bd'].copy()
-        columns_lower = [str(c).lower() for c in bd_df.columns]
 
         # Trouver la colonne enable_routing
-        routing_col = None
-        for col in ['enable_routing', 'unicast_route', 'routing']:
-            if col in columns_lower:
-                routing_col = bd_df.columns[columns_lower.index(col)]
-                break
+        routing_col = self._find_col('bd', ['enable_routing', 'unicast_route', 'routing'])
 
         if not routing_col:
             print("   ⚠️  Impossible de créer le fichier routing_enable - colonne non trouvée")
             return
 
         # Supprimer les colonnes inutiles (description, arp_flooding, l2_unknown_unicast)
-        columns_to_drop = []
-        for col in bd_df.columns:
-            col_lower = str(col).lower()
-            if col_lower in ['description', 'descr', 'desc', 'arp_flooding', 'l2_unknown_unicast', 'unknown_unicast']:
-                columns_to_drop.append(col)
+        drop_names = {'description', 'descr', 'desc', 'arp_flooding', 'l2_unknown_unicast', 'unknown_unicast'}
+        columns_to_drop = [col for name, col in self._get_col_index('bd').items() if name in drop_names]
         if columns_to_drop:
             bd_df = bd_df.drop(columns=columns_to_drop)
 
         # Mettre toutes les valeurs à true (format Ansible standard)
         bd_df[routing_col] = 'true'
 
-        # Créer le fichier Excel avec seulement l'onglet bd
-        with pd.ExcelWriter(routing_enable_file, engine='openpyxl') as writer:
-            bd_df.to_excel(writer, sheet_name='bd', index=False)
+        # Créer le fichier Excel avec seulement l'onglet bd (openpyxl write_only)
+        self._write_sheets_write_only(routing_enable_file, [('bd', bd_df)])
 
         print(f"   📁 Fichier routing_enable créé: {routing_enable_file}")
         print(f"      → Utilisez ce fichier pour réactiver le routage après les travaux")
@@ -2204,24 +2664,14 @@ class FabricConverter:
             Liste des identifiants de leaf, ou None si pattern non reconnu
         """
         # Enlever le suffixe -LIP
-        if not profile_name.upper().endswith('-LIP'):
+        match = _LIP_RE.fullmatch(profile_name)
+        if not match:
             return None
 
-        base_name = profile_name[:-4]  # Enlever -LIP
-
         # Pattern: FABRIC-LEAF ou FABRIC-LEAF1-LEAF2
         # Ex: SF22-121 ou SF22-121-122 ou SF22-121-22
-        parts = base_name.split('-')
-
-        if len(parts) < 2:
-            return None
-
-        # Le premier élément est le fabric (SF22), les suivants sont les leafs
-        leaf_ids = []
-        for part in parts[1:]:
-            # Vérifier si c'est un nombre (leaf id)
-            if part.isdigit():
-                leaf_ids.append(part)
+        # Le premier élément est le fabric (SF22), les suivants numériques sont les leafs
+        leaf_ids = _LIP_LEAF_RE.findall(match.group(1))
 
         return leaf_ids if leaf_ids else None
 
@@ -2382,6 +2832,89 @@ class FabricConverter:
 
         return (None, None, None, None)
 
+    def _parse_interface_lines(self, lines):
+        """
+        Parse des lignes "LEAF  PORT  DESCRIPTION" en une passe (accesseurs .str).
+
+        Lignes ignorées: moins de 3 champs, ou port non entier.
+
+        Returns:
+            Dict {leaf_name (majuscules): [(port, description (majuscules)), ...]}
+        """
+        # Regroupement par leaf en une passe (un seul lookup hash par ligne)
+        leaf_data = defaultdict(list)
+        if not lines:
+            return leaf_data
+
+        parts = pd.Series(list(lines), dtype=object).str.split(n=2)
+        parts = parts[parts.str.len() >= 3]
+        if parts.empty:
+            return leaf_data
+
+        port_strs = parts.str[1]
+        parts = parts[port_strs.str.fullmatch(_INT_RE).astype(bool)]
+        if parts.empty:
+            return leaf_data
+
+        leaves = parts.str[0].str.upper()
+        # int() comme la saisie ligne à ligne (chiffres Unicode, séparateurs _)
+        ports = [int(port_str) for port_str in parts.str[1]]
+        # Description: champs restants rejoints par un seul espace
+        descriptions = parts.str[2].str.split().str.join(' ').str.upper()
+
+        # Ports hors de la plage int64 ignorés (colonnes numpy en aval)
+        port_min, port_max = np.iinfo(np.int64).min, np.iinfo(np.int64).max
+        for leaf_name, port_num, description in zip(leaves, ports, descriptions):
+            if port_min <= port_num <= port_max:
+                leaf_data[leaf_name].append((port_num, description))
+
+        return leaf_data
+
+    def _config_descriptions_data(self):
+        """
+        Descriptions du fichier config parsées une seule fois (_parse_interface_lines).
+
+        Le cache est vidé par load_config_file.
+        """
+        if self._parsed_descriptions is None:
+            self._parsed_descriptions = self._parse_interface_lines(self.interface_config_descriptions)
+        return self._parsed_descriptions
+
+    def _config_sorted_nodes(self):
+        """
+        Node IDs de [INTERFACE_CONFIG_NODE_TO_LEAF] triés (en texte), calculés une seule fois.
+
+        Le cache est vidé par load_config_file.
+        """
+        if self._sorted_node_ids is None:
+            self._sorted_node_ids = sorted(str(n) for n in self.interface_config_node_to_leaf)
+        return self._sorted_node_ids
+
+    def _build_descriptions_map(self, leaf_data, node_to_leaf):
+        """
+        Associe des descriptions parsées (_parse_interface_lines) aux nodes via node_to_leaf.
+
+        Description formatée: (T:SRV E:{AVANT-TIRET} I:{APRÈS-TIRET}).
+
+        Returns:
+            Dict {(node, '1/PORT'): description formatée}
+        """
+        # Map inverse leaf → node construite une fois (le premier node l'emporte)
+        leaf_to_node = {}
+        for node, leaf_name in node_to_leaf.items():
+            leaf_to_node.setdefault(leaf_name.upper(), node)
+
+        descriptions_map = {}
+        for leaf, entries in leaf_data.items():
+            node = leaf_to_node.get(leaf)
+            if not node:
+                continue
+            for port_num, description in entries:
+                e_part, _, i_part = description.partition('-')
+                descriptions_map[(node, f"1/{port_num}")] = f"(T:SRV E:{e_part} I:{i_part})"
+
+        return descriptions_map
+
     def _collect_odd_even_interfaces(self, profile_to_node, interface_type, access_port_df):
         """
         Collecte les interfaces avec la logique paire/impaire.
@@ -2397,7 +2930,7 @@ class FabricConverter:
             access_port_df: DataFrame access_port_to_int_policy_leaf
 
         Returns:
-            Liste de dicts pour interface_config ou None si échec
+            DataFrame pour interface_config ou None si échec
         """
         print("\n" + "-" * 60)
         print("📐 LOGIQUE PAIRE/IMPAIRE")
@@ -2453,20 +2986,7 @@ class FabricConverter:
         print("-" * 60)
         print("Collez vos lignes puis appuyez 2 fois sur Entrée:\n")
 
-        description_lines = []
-        empty_line_count = 0
-        while True:
-            try:
-                line = input()
-                if not line.strip():
-                    empty_line_count += 1
-                    if empty_line_count >= 2:
-                        break
-                else:
-                    empty_line_count = 0
-                    description_lines.append(line.strip())
-            except EOFError:
-                break
+        description_lines = self.read_pasted_lines(empty_lines_to_stop=2)
 
         if not description_lines:
             print("❌ Aucune description fournie")
@@ -2475,24 +2995,7 @@ class FabricConverter:
         print(f"\n   ✅ {len(description_lines)} lignes reçues")
 
         # 4. Parser les descriptions et extraire les leafs
-        leaf_data = {}  # leaf_name -> list of (port, description)
-
-        for line in description_lines:
-            parts = line.split()
-            if len(parts) < 3:
-                continue
-
-            leaf_name = parts[0].upper()
-            try:
-                port_num = int(parts[1])
-            except ValueError:
-                continue
-
-            description = ' '.join(parts[2:])
-
-            if leaf_name not in leaf_data:
-                leaf_data[leaf_name] = []
-            leaf_data[leaf_name].append((port_num, description))
+        leaf_data = self._parse_interface_lines(description_lines)  # leaf_name -> list of (port, description)
 
         if not leaf_data:
             print("❌ Aucune interface parsée")
@@ -2510,8 +3013,7 @@ class FabricConverter:
                 auto_leaf_to_node[leaf] = sorted_nodes[i]
 
         print(f"\n   Auto-mapping leaf → node:")
-        for leaf, node in auto_leaf_to_node.items():
-            print(f"   • {leaf} → {node}")
+        sys.stdout.write(''.join(f"   • {leaf} → {node}\n" for leaf, node in auto_leaf_to_node.items()))
 
         # 6. Identifier smallest et largest node
         if len(sorted_nodes) >= 2:
@@ -2525,85 +3027,218 @@ class FabricConverter:
         print(f"   Plus grosse leaf ({sorted_leaves[-1] if sorted_leaves else 'N/A'}) → node {largest_node} → P4-IPG")
 
         # 7. Appliquer la logique paire/impaire
-        interface_mappings = []
+        interface_mappings = self._build_odd_even_interfaces(
+            leaf_data, auto_leaf_to_node, smallest_node, ipg_p1p2, ipg_p3, ipg_p4, interface_type
+        )
 
+        print(f"\n   ✅ {len(interface_mappings)} interfaces générées avec logique paire/impaire")
+
+        # Afficher un résumé par policy group
+        pg_counts = interface_mappings['policy_group'].value_counts().sort_index()
+
+        print("\n   Répartition par Policy Group:")
+        sys.stdout.write(''.join(f"   • {pg}: {count} interfaces\n" for pg, count in pg_counts.items()))
+
+        return interface_mappings
+
+    def _build_odd_even_interfaces(self, leaf_data, leaf_to_node, smallest_node,
+                                   ipg_p1p2, ipg_p3, ipg_p4, interface_type):
+        """
+        Construit l'onglet interface_config (logique paire/impaire) en colonnes numpy.
+
+        Args:
+            leaf_data: Dict {leaf_name: [(port, description), ...]}
+            leaf_to_node: Dict {leaf_name: node_id} (leafs absentes ignorées)
+            smallest_node: Node ID de la plus petite leaf (ports pairs → P3-IPG)
+            ipg_p1p2, ipg_p3, ipg_p4: Policy groups impairs / pairs petite / pairs grosse leaf
+            interface_type: 'switch_port' ou 'pc_or_vpc'
+
+        Returns:
+            DataFrame interface_config trié par node puis par port
+        """
+        nodes, ports, descriptions = [], [], []
         for leaf_name, ports_data in leaf_data.items():
-            node_id = auto_leaf_to_node.get(leaf_name)
+            node_id = leaf_to_node.get(leaf_name)
 
             if not node_id:
                 print(f"   ⚠️  Leaf '{leaf_name}' non mappée, ignorée")
                 continue
 
             for port_num, description in ports_data:
-                # Logique paire/impaire
-                if port_num % 2 == 1:
-                    # Port impair → P1_P2-IPG
-                    policy_group = ipg_p1p2
-                elif node_id == smallest_node:
-                    # Port pair, plus petit node → P3-IPG
-                    policy_group = ipg_p3
-                else:
-                    # Port pair, plus gros node → P4-IPG
-                    policy_group = ipg_p4
-
-                # Formater la description: (T:SRV E:{AVANT-TIRET} I:{APRÈS-TIRET})
-                desc_upper = description.upper()
-                if '-' in desc_upper:
-                    first_dash = desc_upper.index('-')
-                    e_part = desc_upper[:first_dash]
-                    i_part = desc_upper[first_dash+1:]
-                else:
-                    e_part = desc_upper
-                    i_part = ''
-                formatted_desc = f"(T:SRV E:{e_part} I:{i_part})"
-
-                interface_mappings.append({
-                    'node': node_id,
-                    'interface': f"1/{port_num}",
-                    'policy_group': policy_group,
-                    'role': 'leaf',
-                    'port_type': 'access',
-                    'interface_type': interface_type,
-                    'admin_state': 'up',
-                    'description': formatted_desc
-                })
+                nodes.append(node_id)
+                ports.append(port_num)
+                descriptions.append(description)
+
+        if not nodes:
+            return pd.DataFrame(columns=['node', 'interface', 'policy_group', 'role', 'port_type',
+                                         'interface_type', 'admin_state', 'description'])
+
+        nodes = np.array(nodes, dtype=object)
+        ports = np.array(ports, dtype=np.int64)
+
+        # Logique paire/impaire en codes int8: 0 = impair → P1_P2-IPG,
+        # 1 = pair sur le plus petit node → P3-IPG, 2 = pair autre node → P4-IPG
+        codes = np.where(ports & 1, 0, np.where(nodes == smallest_node, 1, 2)).astype(np.int8)
+        policy_groups = np.array([ipg_p1p2, ipg_p3, ipg_p4], dtype=object)[codes]
+
+        # Formater la description: (T:SRV E:{AVANT-TIRET} I:{APRÈS-TIRET})
+        parts = np.char.partition(np.array(descriptions, dtype=str), '-')
+        formatted = np.char.add(np.char.add(np.char.add('(T:SRV E:', parts[:, 0]), ' I:'), parts[:, 2])
+        formatted = np.char.add(formatted, ')')
+
+        # Trier par node puis par interface (np.lexsort est stable, comme list.sort).
+        # Les nodes sont classés par rang pour garder l'ordre des chaînes.
+        _, node_ranks = np.unique(nodes, return_inverse=True)
+        order = np.lexsort((ports, node_ranks))
+
+        return pd.DataFrame({
+            'node': nodes[order],
+            'interface': np.char.add('1/', ports[order].astype(str)),
+            'policy_group': policy_groups[order],
+            'role': 'leaf',
+            'port_type': 'access',
+            'interface_type': interface_type,
+            'admin_state': 'up',
+            'description': formatted[order]
+        })
+
+    def _group_access_ports(self, access_port_df, profile_to_node, skip_ports=()):
+        """
+        Regroupe les plages de ports par (interface_profile, policy_group).
 
-        # Trier par node puis par interface
-        interface_mappings.sort(key=lambda x: (x['node'], int(x['interface'].split('/')[1]) if '/' in x['interface'] else 0))
+        Lignes filtrées et plages from_port..to_port dépliées en colonnes
+        (np.repeat + offsets), sans boucle par ligne. Les groupes, le selector
+        et la description (première ligne du groupe) ainsi que les interfaces
+        (dédupliquées) suivent l'ordre de l'onglet.
 
-        print(f"\n   ✅ {len(interface_mappings)} interfaces générées avec logique paire/impaire")
+        Les groupes listés dans skip_ports (overrides) sont conservés mais
+        leurs plages ne sont pas dépliées ('interfaces' vide).
 
-        # Afficher un résumé par policy group
-        pg_counts = {}
-        for m in interface_mappings:
-            pg = m['policy_group']
-            pg_counts[pg] = pg_counts.get(pg, 0) + 1
+        Returns:
+            Dict {(profile, policy_group): {'interfaces', 'access_port_selector', 'description'}}
+        """
+        def text(col):
+            values = access_port_df[col]
+            return values.astype(str).where(values.notna(), '')
+
+        profiles = text('interface_profile')
+        policy_groups = text('policy_group')
+        keep = (profiles != '') & (policy_groups != '') & profiles.isin(list(profile_to_node))
+        if not keep.any():
+            return {}
+
+        df = pd.DataFrame({
+            'profile': profiles[keep],
+            'policy_group': policy_groups[keep],
+            'access_port_selector': text('access_port_selector')[keep],
+            'description': text('description')[keep],
+            'from_port': pd.to_numeric(access_port_df['from_port'][keep], errors='coerce'),
+            'to_port': pd.to_numeric(access_port_df['to_port'][keep], errors='coerce'),
+        })
+        group_ids = df.groupby(['profile', 'policy_group'], sort=False).ngroup().to_numpy()
+
+        # Déplier les plages valides: port = from_port + rang dans la plage
+        ranged = df['from_port'].notna().to_numpy() & df['to_port'].notna().to_numpy()
+        if skip_ports:
+            ranged &= ~pd.MultiIndex.from_arrays([df['profile'], df['policy_group']]).isin(list(skip_ports))
+        from_p = np.trunc(df['from_port'].to_numpy(dtype=float, na_value=np.nan)[ranged]).astype(np.int64)
+        to_p = np.trunc(df['to_port'].to_numpy(dtype=float, na_value=np.nan)[ranged]).astype(np.int64)
+        counts = np.maximum(to_p - from_p + 1, 0)
+        starts = np.cumsum(counts) - counts
+        ports = np.arange(counts.sum()) + np.repeat(from_p - starts, counts)
+
+        groups = np.repeat(group_ids[ranged], counts)
+
+        # Dédoublonnage (groupe, port) en numpy: tri stable, on garde la première
+        # occurrence de chaque paire puis on revient à l'ordre de l'onglet
+        order = np.lexsort((ports, groups))
+        first = np.ones(order.size, dtype=bool)
+        first[1:] = (np.diff(groups[order]) != 0) | (np.diff(ports[order]) != 0)
+        kept = np.sort(order[first])
+
+        # Découpage par groupe (tri stable: l'ordre d'apparition est conservé)
+        by_group = kept[np.argsort(groups[kept], kind='stable')]
+        labels = np.char.add('1/', ports[by_group].astype(str))
+        bounds = np.flatnonzero(np.diff(groups[by_group])) + 1
+        interfaces = {
+            int(groups[chunk_start]): chunk.tolist()
+            for chunk_start, chunk in zip(by_group[np.r_[0, bounds]] if by_group.size else [],
+                                          np.split(labels, bounds))
+        }
 
-        print("\n   Répartition par Policy Group:")
-        for pg, count in sorted(pg_counts.items()):
-            print(f"   • {pg}: {count} interfaces")
+        firsts = df.drop_duplicates(['profile', 'policy_group'])
+        return {
+            (profile, policy_group): {
+                'interfaces': interfaces.get(group, []),
+                'access_port_selector': access_port_selector,
+                'description': description
+            }
+            for group, (profile, policy_group, access_port_selector, description) in enumerate(zip(
+                firsts['profile'], firsts['policy_group'],
+                firsts['access_port_selector'], firsts['description']))
+        }
 
-        return interface_mappings
+    def _interface_config_frame(self, nodes, interfaces, policy_groups, descriptions, interface_type):
+        """
+        Construit le DataFrame interface_config à partir de colonnes (listes
+        parallèles), directement dans l'ordre de l'onglet. Les valeurs
+        constantes (role, port_type, interface_type, admin_state) sont
+        diffusées par pandas.
+        """
+        return pd.DataFrame({
+            'node': nodes,
+            'interface': interfaces,
+            'policy_group': policy_groups,
+            'role': 'leaf',
+            'port_type': 'access',
+            'interface_type': interface_type,
+            'admin_state': 'up',
+            'description': descriptions
+        })
+
+    def _apply_descriptions_map(self, interface_df, descriptions_map):
+        """
+        Remplace les descriptions des lignes dont (node, interface) figure dans
+        descriptions_map, par une seule jointure sur un MultiIndex.
+
+        Returns:
+            Nombre de lignes mises à jour
+        """
+        if not descriptions_map:
+            return 0
+
+        overrides = pd.Series(list(descriptions_map.values()), dtype=object,
+                              index=pd.MultiIndex.from_tuples(list(descriptions_map)))
+        keys = pd.MultiIndex.from_arrays([interface_df['node'], interface_df['interface']])
+        new_desc = overrides.reindex(keys).to_numpy()
+        mask = pd.notna(new_desc)
+        interface_df.loc[mask, 'description'] = new_desc[mask]
+        return int(mask.sum())
 
     def _finalize_interface_config(self, interface_mappings):
         """
         Finalise la création de l'onglet interface_config.
 
         Args:
-            interface_mappings: Liste de dicts avec les données d'interface
+            interface_mappings: DataFrame des interfaces (_build_odd_even_interfaces
+                ou _interface_config_frame)
         """
-        if not interface_mappings:
+        if interface_mappings is None or len(interface_mappings) == 0:
             print("   ⚠️  Aucune interface à créer")
             return
 
-        # Créer le DataFrame
-        interface_config_df = pd.DataFrame(interface_mappings)
+        # Déjà construit dans l'ordre des colonnes: pas de copie
         columns_order = ['node', 'interface', 'policy_group', 'role', 'port_type',
                        'interface_type', 'admin_state', 'description']
-        interface_config_df = interface_config_df[columns_order]
+        if list(interface_mappings.columns) == columns_order:
+            interface_config_df = interface_mappings
+        else:
+            interface_config_df = interface_mappings[columns_order]
+        interface_config_df = self._categorize_interface_columns(interface_config_df)
 
         # Ajouter le nouvel onglet interface_config
         self.excel_data['interface_config'] = interface_config_df
+        self._data_version += 1
 
         # Supprimer les onglets sources
         if 'interface_policy_leaf_profile' in self.excel_data:
@@ -2635,6 +3270,12 @@ class FabricConverter:
             print("   ⚠️  Onglet 'access_port_to_int_policy_leaf' non trouvé - étape ignorée")
             return
 
+        # Mode non interactif (stdin redirigé): pas de questions, le fichier config
+        # ([INTERFACE_CONFIG]) est le chemin prévu pour les exécutions scriptées
+        if not sys.stdin.isatty():
+            print("   → Mode non interactif détecté - étape ignorée (utilisez le fichier de configuration)")
+            return
+
         # Demander si l'utilisateur veut faire cette conversion
         print("\nVoulez-vous convertir les Interface Profiles vers interface_config? [o/N]: ", end="", flush=True)
         choice = input().strip().lower()
@@ -2642,14 +3283,12 @@ class FabricConverter:
             print("   → Conversion interface_config ignorée")
             return
 
-        profile_df = self.excel_data['interface_policy_leaf_profile']
         access_port_df = self.excel_data['access_port_to_int_policy_leaf']
 
         # 1. Extraire les interface_profile uniques
-        interface_profiles = profile_df['interface_profile'].dropna().unique().tolist()
+        interface_profiles = self._unique_values('interface_policy_leaf_profile', 'interface_profile').tolist()
         print(f"\n📋 Interface Profiles trouvés: {len(interface_profiles)}")
-        for ip in interface_profiles:
-            print(f"   • {ip}")
+        sys.stdout.write(''.join(f"   • {ip}\n" for ip in interface_profiles))
 
         # 2. Demander le type d'interface (AVANT le mapping pour déterminer si VPC)
         print("\n" + "-" * 60)
@@ -2741,7 +3380,7 @@ class FabricConverter:
         if method_choice != '2':
             # Logique paire/impaire
             interface_mappings = self._collect_odd_even_interfaces(profile_to_node, interface_type, access_port_df)
-            if interface_mappings:
+            if interface_mappings is not None and len(interface_mappings):
                 # Aller directement à la création du DataFrame (étape 7)
                 self._finalize_interface_config(interface_mappings)
             return
@@ -2751,45 +3390,16 @@ class FabricConverter:
         print("🔄 MAPPING DES INTERFACES PAR POLICY GROUP")
         print("-" * 60)
 
-        grouped = {}
-        for idx, row in access_port_df.iterrows():
-            profile = str(row['interface_profile']) if pd.notna(row['interface_profile']) else ''
-            policy_group = str(row['policy_group']) if pd.notna(row['policy_group']) else ''
-            access_port_selector = str(row['access_port_selector']) if pd.notna(row['access_port_selector']) else ''
-            from_port = row['from_port'] if pd.notna(row['from_port']) else ''
-            to_port = row['to_port'] if pd.notna(row['to_port']) else ''
-            description = str(row['description']) if pd.notna(row['description']) else ''
-
-            if not profile or not policy_group:
-                continue
-
-            if profile not in profile_to_node:
-                continue
-
-            key = (profile, policy_group)
-            if key not in grouped:
-                grouped[key] = {
-                    'interfaces': [],
-                    'access_port_selector': access_port_selector,
-                    'description': description
-                }
-
-            try:
-                from_p = int(float(from_port))
-                to_p = int(float(to_port))
-                for port in range(from_p, to_p + 1):
-                    interface = f"1/{port}"
-                    if interface not in grouped[key]['interfaces']:
-                        grouped[key]['interfaces'].append(interface)
-            except (ValueError, TypeError):
-                pass
+        grouped = self._group_access_ports(access_port_df, profile_to_node)
 
         if not grouped:
             print("\n❌ Aucun groupe trouvé!")
             return
 
         # 5. Pour chaque groupe, demander les nouvelles interfaces
-        interface_mappings = []
+        # Colonnes en listes parallèles (une entrée par interface)
+        nodes, ifaces, policy_groups, descriptions = [], [], [], []
+        unique_nodes = set()
 
         for (profile, policy_group), data in grouped.items():
             node_val = profile_to_node[profile]
@@ -2811,8 +3421,7 @@ class FabricConverter:
             print(f"   Policy Group: {policy_group}")
             print(f"   Node destination: {node_display}" + (" (VPC)" if len(node_list) > 1 else ""))
             print(f"\n   Interfaces actuelles:")
-            for iface in sorted(interfaces, key=lambda x: int(x.split('/')[1]) if '/' in x else 0):
-                print(f"      • {iface}")
+            sys.stdout.write(''.join(f"      • {iface}\n" for iface in sorted(interfaces, key=_iface_port_num)))
 
             print(f"\n   Entrez les nouvelles interfaces (séparées par virgule)")
             print(f"   Format: 1/1, 1/2, 1/3 ou eth1/1, eth1/2")
@@ -2822,32 +3431,25 @@ class FabricConverter:
             new_interfaces_input = input().strip()
 
             if new_interfaces_input:
-                new_interfaces = []
-                for iface in new_interfaces_input.split(','):
-                    iface = iface.strip()
-                    if iface.lower().startswith('eth'):
-                        iface = iface[3:]
-                    if iface:
-                        new_interfaces.append(iface)
+                new_interfaces = [iface for iface in (_ETH_PREFIX_RE.sub('', tok.strip(), count=1)
+                                                      for tok in new_interfaces_input.split(','))
+                                  if iface]
             else:
                 new_interfaces = interfaces
 
             # Créer les entrées - pour VPC, créer une entrée par node
             for node_id in node_list:
+                unique_nodes.add(node_id)
                 for iface in new_interfaces:
-                    interface_mappings.append({
-                        'node': node_id,
-                        'interface': iface,
-                        'policy_group': policy_group,
-                        'role': 'leaf',
-                        'port_type': 'access',
-                        'interface_type': interface_type,
-                        'admin_state': 'up',
-                        'description': description
-                    })
+                    nodes.append(node_id)
+                    ifaces.append(iface)
+                    policy_groups.append(policy_group)
+                    descriptions.append(description)
+
+        interface_config_df = self._interface_config_frame(nodes, ifaces, policy_groups, descriptions, interface_type)
 
         # 6. Mapping des descriptions personnalisées
-        if interface_mappings:
+        if len(interface_config_df):
             print("\n" + "=" * 60)
             print("📝 MAPPING DES DESCRIPTIONS")
             print("=" * 60)
@@ -2860,8 +3462,6 @@ class FabricConverter:
                 print("🏷️  MAPPING NODE ID → NOM DE LEAF")
                 print("-" * 60)
 
-                # Obtenir les node_id uniques
-                unique_nodes = list(set([m['node'] for m in interface_mappings]))
                 node_to_leaf = {}
 
                 for node in sorted(unique_nodes):
@@ -2883,72 +3483,21 @@ class FabricConverter:
                     print("\n   Collez votre liste puis appuyez 2 fois sur Entrée pour terminer:")
                     print("-" * 60)
 
-                    description_lines = []
-                    empty_line_count = 0
-                    while True:
-                        try:
-                            line = input()
-                            if not line.strip():
-                                empty_line_count += 1
-                                if empty_line_count >= 2:
-                                    break
-                            else:
-                                empty_line_count = 0
-                                description_lines.append(line.strip())
-                        except EOFError:
-                            break
+                    description_lines = self.read_pasted_lines(empty_lines_to_stop=2)
 
                     print(f"\n   ✅ {len(description_lines)} lignes de description reçues")
 
-                    # 6c. Parser et associer les descriptions
-                    descriptions_map = {}  # (node, interface) → description formatée
-
-                    for line in description_lines:
-                        # Parser: LEAF  INTERFACE  DESCRIPTION
-                        parts = line.split()
-                        if len(parts) >= 3:
-                            leaf = parts[0].upper()
-                            try:
-                                iface_num = int(parts[1])
-                                iface = f"1/{iface_num}"
-                            except ValueError:
-                                continue
-
-                            # Trouver le node_id correspondant au leaf
-                            node_for_leaf = None
-                            for node, leaf_name in node_to_leaf.items():
-                                if leaf_name == leaf:
-                                    node_for_leaf = node
-                                    break
-
-                            if node_for_leaf:
-                                # Description = tout après le numéro d'interface
-                                desc_text = ' '.join(parts[2:]).upper()
-
-                                # Formater: (T:SRV E:{AVANT-TIRET} I:{APRÈS-TIRET})
-                                if '-' in desc_text:
-                                    first_dash = desc_text.index('-')
-                                    e_part = desc_text[:first_dash]
-                                    i_part = desc_text[first_dash+1:]
-                                else:
-                                    e_part = desc_text
-                                    i_part = ''
-
-                                formatted_desc = f"(T:SRV E:{e_part} I:{i_part})"
-                                descriptions_map[(node_for_leaf, iface)] = formatted_desc
-
-                    # 6d. Appliquer les descriptions aux interfaces
-                    updated_count = 0
-                    for mapping in interface_mappings:
-                        key = (mapping['node'], mapping['interface'])
-                        if key in descriptions_map:
-                            mapping['description'] = descriptions_map[key]
-                            updated_count += 1
+                    # 6c. Parser et associer les descriptions: (node, interface) → description formatée
+                    descriptions_map = self._build_descriptions_map(self._parse_interface_lines(description_lines),
+                                                                    node_to_leaf)
+
+                    # 6d. Appliquer les descriptions aux interfaces (jointure vectorisée)
+                    updated_count = self._apply_descriptions_map(interface_config_df, descriptions_map)
 
                     print(f"\n   ✅ {updated_count} descriptions mises à jour")
 
-        # 7. Créer le DataFrame et l'ajouter à l'Excel
-        self._finalize_interface_config(interface_mappings)
+        # 7. Ajouter le DataFrame à l'Excel
+        self._finalize_interface_config(interface_config_df)
 
     # =========================================================================
     # MODE FICHIER DE CONFIGURATION (texte plat INI-style)
@@ -2981,178 +3530,101 @@ class FabricConverter:
         # Découvrir L3Out (bd_to_l3out)
         l3outs = []
         if 'bd_to_l3out' in self.excel_data:
-            df = self.excel_data['bd_to_l3out']
-            columns_lower = [str(c).lower() for c in df.columns]
-            for col_name in ['l3out', 'l3out_name']:
-                if col_name in columns_lower:
-                    idx = columns_lower.index(col_name)
-                    l3out_col = df.columns[idx]
-                    l3outs = sorted([str(v) for v in df[l3out_col].dropna().unique() if v and str(v).strip()])
-                    break
+            l3out_col = self._find_col('bd_to_l3out', ['l3out', 'l3out_name'])
+            if l3out_col is not None:
+                # Filtre des valeurs vides/blanches en colonne (accesseurs .str)
+                values = pd.Series(self._unique_values('bd_to_l3out', l3out_col), dtype=object)
+                texts = values.astype(str)
+                l3outs = sorted(texts[values.astype(bool) & (texts.str.strip() != '')].tolist())
 
         # Découvrir interface profiles (pour interface_config)
         interface_profiles_list = []
         if 'interface_policy_leaf_profile' in self.excel_data:
-            profile_df = self.excel_data['interface_policy_leaf_profile']
-            interface_profiles_list = profile_df['interface_profile'].dropna().unique().tolist()
-
-        # Écrire le fichier
-        lines = []
-        lines.append("# ============================================================")
-        lines.append("# FABRIC CONVERTER - Fichier de configuration")
-        lines.append(f"# Genere depuis: {os.path.basename(self.excel_file)}")
-        lines.append("# ============================================================")
-        lines.append("#")
-        lines.append("# FORMAT:")
-        lines.append("#   Sections [NOM]: contiennent des paires source = destination")
-        lines.append("#   Modifiez la DESTINATION pour convertir (gardez identique = pas de changement)")
-        lines.append("#   Sections paste: collez vos lignes telles quelles")
-        lines.append("#")
-        lines.append("# ============================================================")
-        lines.append("")
-
-        # TENANTS
-        lines.append("[TENANTS]")
-        lines.append("# Format: source = destination")
-        for t in global_values['tenants']:
-            lines.append(f"{t} = {t}")
-        lines.append("")
-
-        # VRFS
-        lines.append("[VRFS]")
-        lines.append("# Format: source = destination")
-        for v in global_values['vrfs']:
-            lines.append(f"{v} = {v}")
-        lines.append("")
-
-        # APS
-        lines.append("[APS]")
-        lines.append("# Format: source = destination")
-        for a in global_values['aps']:
-            lines.append(f"{a} = {a}")
-        lines.append("")
-
-        # L3OUT (bd_to_l3out)
-        lines.append("[L3OUT]")
-        lines.append("# L3Out references par les Bridge Domains")
-        lines.append("# Format: source = destination")
-        for l in l3outs:
-            lines.append(f"{l} = {l}")
-        lines.append("")
-
-        # NODE_IDS
-        lines.append("[NODE_IDS]")
-        lines.append("# Format: source = destination")
-        for nid in sorted(node_ids.keys()):
-            lines.append(f"{nid} = {nid}")
-        lines.append("")
-
-        # NODE_PROFILES
-        lines.append("[NODE_PROFILES]")
-        lines.append("# Format: source = destination")
-        for np in sorted(node_profiles.keys()):
-            lines.append(f"{np} = {np}")
-        lines.append("")
-
-        # INTERFACE_PROFILES
-        lines.append("[INTERFACE_PROFILES]")
-        lines.append("# Interface Profiles L3Out (pas les Leaf profiles)")
-        lines.append("# Format: source = destination")
-        for ip in sorted(int_profiles.keys()):
-            lines.append(f"{ip} = {ip}")
-        lines.append("")
-
-        # PATH_EPS
-        lines.append("[PATH_EPS]")
-        lines.append("# Format: source = destination")
-        for pe in sorted(path_eps.keys()):
-            lines.append(f"{pe} = {pe}")
-        lines.append("")
-
-        # LOCAL_AS
-        lines.append("[LOCAL_AS]")
-        lines.append("# Format: source = destination")
-        for la in sorted(local_as_values.keys()):
-            lines.append(f"{la} = {la}")
-        lines.append("")
-
-        # MATCH_RULES
-        lines.append("[MATCH_RULES]")
-        lines.append("# Format: source = destination")
-        for mr in sorted(match_rules.keys()):
-            lines.append(f"{mr} = {mr}")
-        lines.append("")
-
-        # ROUTE_CONTROL_PROFILES
-        lines.append("[ROUTE_CONTROL_PROFILES]")
-        lines.append("# Format: source = destination")
-        for rcp in sorted(rc_profiles.keys()):
-            lines.append(f"{rcp} = {rcp}")
-        lines.append("")
-
-        # ROUTE_CONTROL_CONTEXTS
-        lines.append("[ROUTE_CONTROL_CONTEXTS]")
-        lines.append("# Format: source = destination")
-        for rcc in sorted(rc_contexts.keys()):
-            lines.append(f"{rcc} = {rcc}")
-        lines.append("")
-
-        # OPTIONS
-        lines.append("[OPTIONS]")
-        lines.append("# disable_bd_routing: true ou false")
-        lines.append("disable_bd_routing = false")
-        lines.append("")
-
-        # VLAN_DESCRIPTIONS
-        lines.append("[VLAN_DESCRIPTIONS]")
-        lines.append("# Collez vos lignes VLAN,DESCRIPTION (meme format que le wizard)")
-        lines.append("# Exemple: 200,RL00001_10.1.1.1/24_Serveur_Web")
-        lines.append("# Laissez vide si pas de modification")
-        lines.append("")
-
-        # INTERFACE_CONFIG
-        lines.append("[INTERFACE_CONFIG]")
-        lines.append("# Conversion Interface Profile -> interface_config")
-        lines.append("# enabled: true ou false")
-        lines.append("# method: odd_even (paire/impaire) ou manual (saisie manuelle)")
-        lines.append("# interface_type: switch_port ou pc_or_vpc")
-        lines.append("enabled = false")
-        lines.append("method = odd_even")
-        lines.append("interface_type = switch_port")
-        lines.append("")
-
-        # INTERFACE_CONFIG_PROFILE_TO_NODE
-        lines.append("[INTERFACE_CONFIG_PROFILE_TO_NODE]")
-        lines.append("# Format: profile = node_id")
-        if interface_profiles_list:
-            for ip in interface_profiles_list:
-                lines.append(f"# {ip} = ")
-        lines.append("")
-
-        # INTERFACE_CONFIG_INTERFACES
-        lines.append("[INTERFACE_CONFIG_INTERFACES]")
-        lines.append("# Format: profile, policy_group, interfaces")
-        lines.append("# Exemple: LeafProf_101, PG_Server, 1/1, 1/2, 1/3")
-        lines.append("# Laissez vide = garder les interfaces depuis Excel")
-        lines.append("")
-
-        # INTERFACE_CONFIG_NODE_TO_LEAF
-        lines.append("[INTERFACE_CONFIG_NODE_TO_LEAF]")
-        lines.append("# Format: node_id = nom_leaf")
-        lines.append("# Exemple: 201 = SFXX-XXX")
-        lines.append("# (Utilise pour les descriptions personnalisees)")
-        lines.append("")
-
-        # INTERFACE_CONFIG_DESCRIPTIONS
-        lines.append("[INTERFACE_CONFIG_DESCRIPTIONS]")
-        lines.append("# Meme format que le wizard: NOM_LEAF  NO_INTERFACE  DESCRIPTION")
-        lines.append("# Exemple: SFXX-XXX  3  VPZESX1011-onb2-p1-vmnic2")
-        lines.append("# Collez vos lignes, 2 entrees vides = fin")
-        lines.append("")
-
-        # Écrire le fichier
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(lines))
+            interface_profiles_list = self._unique_values('interface_policy_leaf_profile', 'interface_profile').tolist()
+
+        def identity_lines(values):
+            """Lignes 'source = source' (destination à modifier par l'utilisateur)"""
+            return (f"{v} = {v}" for v in values)
+
+        def write_section(f, header, entries=()):
+            """Écrit une section précédée d'une ligne vide: en-tête puis entrées"""
+            f.write('\n')
+            f.writelines(f"{line}\n" for line in header)
+            f.writelines(f"{entry}\n" for entry in entries)
+
+        # Écrire le fichier section par section (pas de liste de lignes intermédiaire)
+        with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.write(
+                "# ============================================================\n"
+                "# FABRIC CONVERTER - Fichier de configuration\n"
+                f"# Genere depuis: {os.path.basename(self.excel_file)}\n"
+                "# ============================================================\n"
+                "#\n"
+                "# FORMAT:\n"
+                "#   Sections [NOM]: contiennent des paires source = destination\n"
+                "#   Modifiez la DESTINATION pour convertir (gardez identique = pas de changement)\n"
+                "#   Sections paste: collez vos lignes telles quelles\n"
+                "#\n"
+                "# ============================================================\n"
+            )
+
+            source_dest = "# Format: source = destination"
+            write_section(f, ["[TENANTS]", source_dest], identity_lines(global_values['tenants']))
+            write_section(f, ["[VRFS]", source_dest], identity_lines(global_values['vrfs']))
+            write_section(f, ["[APS]", source_dest], identity_lines(global_values['aps']))
+            write_section(f, ["[L3OUT]", "# L3Out references par les Bridge Domains", source_dest],
+                          identity_lines(l3outs))
+            write_section(f, ["[NODE_IDS]", source_dest], identity_lines(sorted(node_ids)))
+            write_section(f, ["[NODE_PROFILES]", source_dest], identity_lines(sorted(node_profiles)))
+            write_section(f, ["[INTERFACE_PROFILES]", "# Interface Profiles L3Out (pas les Leaf profiles)", source_dest],
+                          identity_lines(sorted(int_profiles)))
+            write_section(f, ["[PATH_EPS]", source_dest], identity_lines(sorted(path_eps)))
+            write_section(f, ["[LOCAL_AS]", source_dest], identity_lines(sorted(local_as_values)))
+            write_section(f, ["[MATCH_RULES]", source_dest], identity_lines(sorted(match_rules)))
+            write_section(f, ["[ROUTE_CONTROL_PROFILES]", source_dest], identity_lines(sorted(rc_profiles)))
+            write_section(f, ["[ROUTE_CONTROL_CONTEXTS]", source_dest], identity_lines(sorted(rc_contexts)))
+
+            write_section(f, [
+                "[OPTIONS]",
+                "# disable_bd_routing: true ou false",
+                "disable_bd_routing = false",
+            ])
+            write_section(f, [
+                "[VLAN_DESCRIPTIONS]",
+                "# Collez vos lignes VLAN,DESCRIPTION (meme format que le wizard)",
+                "# Exemple: 200,RL00001_10.1.1.1/24_Serveur_Web",
+                "# Laissez vide si pas de modification",
+            ])
+            write_section(f, [
+                "[INTERFACE_CONFIG]",
+                "# Conversion Interface Profile -> interface_config",
+                "# enabled: true ou false",
+                "# method: odd_even (paire/impaire) ou manual (saisie manuelle)",
+                "# interface_type: switch_port ou pc_or_vpc",
+                "enabled = false",
+                "method = odd_even",
+                "interface_type = switch_port",
+            ])
+            write_section(f, ["[INTERFACE_CONFIG_PROFILE_TO_NODE]", "# Format: profile = node_id"],
+                          (f"# {ip} = " for ip in interface_profiles_list))
+            write_section(f, [
+                "[INTERFACE_CONFIG_INTERFACES]",
+                "# Format: profile, policy_group, interfaces",
+                "# Exemple: LeafProf_101, PG_Server, 1/1, 1/2, 1/3",
+                "# Laissez vide = garder les interfaces depuis Excel",
+            ])
+            write_section(f, [
+                "[INTERFACE_CONFIG_NODE_TO_LEAF]",
+                "# Format: node_id = nom_leaf",
+                "# Exemple: 201 = SFXX-XXX",
+                "# (Utilise pour les descriptions personnalisees)",
+            ])
+            write_section(f, [
+                "[INTERFACE_CONFIG_DESCRIPTIONS]",
+                "# Meme format que le wizard: NOM_LEAF  NO_INTERFACE  DESCRIPTION",
+                "# Exemple: SFXX-XXX  3  VPZESX1011-onb2-p1-vmnic2",
+                "# Collez vos lignes, 2 entrees vides = fin",
+            ])
 
         print(f"\n✅ Fichier de configuration généré: {output_file}")
         print(f"   • {len(global_values['tenants'])} tenant(s)")
@@ -3173,101 +3645,108 @@ class FabricConverter:
             print(f"❌ Fichier non trouvé: {config_file}")
             return False
 
-        with open(config_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+        # Sections source = destination: dict cible rempli directement
+        self.tenant_mapping = {}
+        self.vrf_mapping = {}
+        self.ap_mapping = {}
+        self.l3out_mapping = {}
+        self.node_id_mapping = {}
+        self.node_profile_mapping = {}
+        self.int_profile_mapping = {}
+        self.path_ep_mapping = {}
+        self.local_as_mapping = {}
+        self.match_rule_mapping = {}
+        self.route_control_profile_mapping = {}
+        self.route_control_context_mapping = {}
+        self.interface_config_profile_to_node = {}
+        self.interface_config_node_to_leaf = {}
+        options = {}
+        ic_options = {}
+        mapping_targets = {
+            'TENANTS': self.tenant_mapping,
+            'VRFS': self.vrf_mapping,
+            'APS': self.ap_mapping,
+            'L3OUT': self.l3out_mapping,
+            'NODE_IDS': self.node_id_mapping,
+            'NODE_PROFILES': self.node_profile_mapping,
+            'INTERFACE_PROFILES': self.int_profile_mapping,
+            'PATH_EPS': self.path_ep_mapping,
+            'LOCAL_AS': self.local_as_mapping,
+            'MATCH_RULES': self.match_rule_mapping,
+            'ROUTE_CONTROL_PROFILES': self.route_control_profile_mapping,
+            'ROUTE_CONTROL_CONTEXTS': self.route_control_context_mapping,
+            'OPTIONS': options,
+            'INTERFACE_CONFIG': ic_options,
+            'INTERFACE_CONFIG_PROFILE_TO_NODE': self.interface_config_profile_to_node,
+            'INTERFACE_CONFIG_NODE_TO_LEAF': self.interface_config_node_to_leaf,
+        }
 
-        # Parser les sections
-        current_section = None
-        section_data = defaultdict(list)
+        # Sections paste: une fonction par ligne
+        def add_vlan_description(line):
+            match = _VLAN_LINE_RE.fullmatch(line)
+            if match:
+                self.vlan_descriptions.append((int(match.group(1)), match.group(2)))
 
-        for line in content.split('\n'):
-            stripped = line.strip()
+        def add_interface_list(line):
+            # Format: profile, policy_group, interfaces...
+            if ',' in line:
+                parts = [p.strip() for p in line.split(',')]
+                if len(parts) >= 3:
+                    self.interface_config_profiles.append(parts[0])
+                    self.interface_config_policy_groups.append(parts[1])
+                    self.interface_config_interface_lists.append(parts[2:])
+
+        # Descriptions d'interfaces: lignes brutes
+        self.interface_config_descriptions = []
+        self._parsed_descriptions = None
+        self._sorted_node_ids = None
+        paste_targets = {
+            'VLAN_DESCRIPTIONS': add_vlan_description,
+            'INTERFACE_CONFIG_INTERFACES': add_interface_list,
+            'INTERFACE_CONFIG_DESCRIPTIONS': self.interface_config_descriptions.append,
+        }
 
-            # Ignorer les commentaires et lignes vides
-            if not stripped or stripped.startswith('#'):
-                continue
+        # Une seule passe sur le fichier: sections et lignes traitées au fil de la lecture
+        mapping = paste = None
+        with open(config_file, 'r', encoding='utf-8') as f:
+            for raw in f:
+                line = raw.strip()
 
-            # Détecter une section
-            if stripped.startswith('[') and stripped.endswith(']'):
-                current_section = stripped[1:-1]
-                continue
+                # Ignorer les commentaires et lignes vides
+                if not line or line[0] == '#':
+                    continue
+
+                # Détecter une section
+                if line[0] == '[' and line[-1] == ']':
+                    mapping = mapping_targets.get(line[1:-1])
+                    paste = paste_targets.get(line[1:-1])
+                    continue
 
-            if current_section:
-                section_data[current_section].append(stripped)
-
-        # Parser les mappings source = destination
-        def parse_mappings(section_name):
-            mapping = {}
-            for line in section_data.get(section_name, []):
-                if '=' in line:
-                    parts = line.split('=', 1)
-                    src = parts[0].strip()
-                    dest = parts[1].strip()
-                    if src and dest:
+                if mapping is not None:
+                    src, sep, dest = line.partition('=')
+                    src = src.strip()
+                    dest = dest.strip()
+                    if sep and src and dest:
                         mapping[src] = dest
-            return mapping
-
-        # Remplir les mappings
-        self.tenant_mapping = parse_mappings('TENANTS')
-        self.vrf_mapping = parse_mappings('VRFS')
-        self.ap_mapping = parse_mappings('APS')
-        self.l3out_mapping = parse_mappings('L3OUT')
-        self.node_id_mapping = parse_mappings('NODE_IDS')
-        self.node_profile_mapping = parse_mappings('NODE_PROFILES')
-        self.int_profile_mapping = parse_mappings('INTERFACE_PROFILES')
-        self.path_ep_mapping = parse_mappings('PATH_EPS')
-        self.local_as_mapping = parse_mappings('LOCAL_AS')
-        self.match_rule_mapping = parse_mappings('MATCH_RULES')
-        self.route_control_profile_mapping = parse_mappings('ROUTE_CONTROL_PROFILES')
-        self.route_control_context_mapping = parse_mappings('ROUTE_CONTROL_CONTEXTS')
-
-        # Parser les options
-        options = parse_mappings('OPTIONS')
-        self.disable_bd_routing = options.get('disable_bd_routing', 'false').lower() in ['true', 'oui', 'yes', 'o']
+                elif paste is not None:
+                    paste(line)
 
-        # Parser les descriptions VLAN
-        for line in section_data.get('VLAN_DESCRIPTIONS', []):
-            if ',' in line:
-                parts = line.split(',', 1)
-                vlan_str = parts[0].strip()
-                description = parts[1].strip() if len(parts) > 1 else ''
-                try:
-                    vlan = int(vlan_str)
-                    if description:
-                        self.vlan_descriptions.append((vlan, description))
-                except ValueError:
-                    pass
+        # Options
+        self.disable_bd_routing = options.get('disable_bd_routing', 'false').lower() in ['true', 'oui', 'yes', 'o']
 
-        # Parser interface_config
-        ic_options = parse_mappings('INTERFACE_CONFIG')
+        # Options interface_config
         self.interface_config_enabled = ic_options.get('enabled', 'false').lower() in ['true', 'oui', 'yes', 'o']
         self.interface_config_method = ic_options.get('method', 'odd_even').lower()
         self.interface_config_type = ic_options.get('interface_type', 'switch_port')
 
-        self.interface_config_profile_to_node = parse_mappings('INTERFACE_CONFIG_PROFILE_TO_NODE')
-        self.interface_config_node_to_leaf = parse_mappings('INTERFACE_CONFIG_NODE_TO_LEAF')
-
-        # Parser interface config interfaces (format: profile, policy_group, interfaces...)
-        for line in section_data.get('INTERFACE_CONFIG_INTERFACES', []):
-            if ',' in line:
-                self.interface_config_interfaces.append(line)
-
-        # Parser interface config descriptions (lignes brutes)
-        self.interface_config_descriptions = section_data.get('INTERFACE_CONFIG_DESCRIPTIONS', [])
-
         # Afficher le résumé
-        changes_count = sum(1 for k, v in self.tenant_mapping.items() if k != v)
-        changes_count += sum(1 for k, v in self.vrf_mapping.items() if k != v)
-        changes_count += sum(1 for k, v in self.ap_mapping.items() if k != v)
-        changes_count += sum(1 for k, v in self.l3out_mapping.items() if k != v)
-        changes_count += sum(1 for k, v in self.node_id_mapping.items() if k != v)
-        changes_count += sum(1 for k, v in self.node_profile_mapping.items() if k != v)
-        changes_count += sum(1 for k, v in self.int_profile_mapping.items() if k != v)
-        changes_count += sum(1 for k, v in self.path_ep_mapping.items() if k != v)
-        changes_count += sum(1 for k, v in self.local_as_mapping.items() if k != v)
-        changes_count += sum(1 for k, v in self.match_rule_mapping.items() if k != v)
-        changes_count += sum(1 for k, v in self.route_control_profile_mapping.items() if k != v)
-        changes_count += sum(1 for k, v in self.route_control_context_mapping.items() if k != v)
+        mappings = (
+            self.tenant_mapping, self.vrf_mapping, self.ap_mapping, self.l3out_mapping,
+            self.node_id_mapping, self.node_profile_mapping, self.int_profile_mapping,
+            self.path_ep_mapping, self.local_as_mapping, self.match_rule_mapping,
+            self.route_control_profile_mapping, self.route_control_context_mapping
+        )
+        changes_count = sum(sum(map(operator.ne, m.keys(), m.values())) for m in mappings)
 
         print(f"\n✅ Configuration chargée:")
         print(f"   • {changes_count} mapping(s) avec changement")
@@ -3308,29 +3787,10 @@ class FabricConverter:
         print(f"   • {ipg_p3} (pairs, petite leaf)")
         print(f"   • {ipg_p4} (pairs, grosse leaf)")
 
-        # Inverser le mapping: node_to_leaf → leaf_to_node
         node_to_leaf = self.interface_config_node_to_leaf
-        leaf_to_node = {v.upper(): k for k, v in node_to_leaf.items()}
 
         # Parser les descriptions
-        leaf_data = {}  # leaf_name -> list of (port, description)
-
-        for line in self.interface_config_descriptions:
-            parts = line.split()
-            if len(parts) < 3:
-                continue
-
-            leaf_name = parts[0].upper()
-            try:
-                port_num = int(parts[1])
-            except ValueError:
-                continue
-
-            description = ' '.join(parts[2:])
-
-            if leaf_name not in leaf_data:
-                leaf_data[leaf_name] = []
-            leaf_data[leaf_name].append((port_num, description))
+        leaf_data = self._config_descriptions_data()  # leaf_name -> list of (port, description)
 
         if not leaf_data:
             print("   ⚠️  Aucune interface parsée depuis les descriptions")
@@ -3338,7 +3798,7 @@ class FabricConverter:
 
         # Trier les leafs et créer le mapping automatique
         sorted_leaves = sorted(leaf_data.keys())
-        sorted_nodes = sorted([str(n) for n in node_to_leaf.keys()])
+        sorted_nodes = self._config_sorted_nodes()
 
         # Recréer le mapping basé sur le tri
         auto_leaf_to_node = {}
@@ -3347,8 +3807,7 @@ class FabricConverter:
                 auto_leaf_to_node[leaf] = sorted_nodes[i]
 
         print(f"\n   Mapping automatique leaf → node:")
-        for leaf, node in auto_leaf_to_node.items():
-            print(f"   • {leaf} → {node}")
+        sys.stdout.write(''.join(f"   • {leaf} → {node}\n" for leaf, node in auto_leaf_to_node.items()))
 
         # Identifier smallest et largest node
         if len(sorted_nodes) >= 2:
@@ -3362,65 +3821,22 @@ class FabricConverter:
         print(f"   Plus grosse leaf ({sorted_leaves[-1] if sorted_leaves else 'N/A'}) → node {largest_node} → P4-IPG")
 
         # Appliquer la logique paire/impaire
-        interface_mappings = []
-
-        for leaf_name, ports_data in leaf_data.items():
-            node_id = auto_leaf_to_node.get(leaf_name)
-
-            if not node_id:
-                # Essayer de matcher avec leaf_to_node original
-                node_id = leaf_to_node.get(leaf_name)
-
-            if not node_id:
-                print(f"   ⚠️  Leaf '{leaf_name}' non mappée, ignorée")
-                continue
-
-            for port_num, description in ports_data:
-                # Logique paire/impaire
-                if port_num % 2 == 1:
-                    # Port impair → P1_P2-IPG
-                    policy_group = ipg_p1p2
-                elif node_id == smallest_node:
-                    # Port pair, plus petit node → P3-IPG
-                    policy_group = ipg_p3
-                else:
-                    # Port pair, plus gros node → P4-IPG
-                    policy_group = ipg_p4
-
-                # Formater la description: (T:SRV E:{AVANT-TIRET} I:{APRÈS-TIRET})
-                desc_upper = description.upper()
-                if '-' in desc_upper:
-                    first_dash = desc_upper.index('-')
-                    e_part = desc_upper[:first_dash]
-                    i_part = desc_upper[first_dash+1:]
-                else:
-                    e_part = desc_upper
-                    i_part = ''
-                formatted_desc = f"(T:SRV E:{e_part} I:{i_part})"
-
-                interface_mappings.append({
-                    'node': node_id,
-                    'interface': f"1/{port_num}",
-                    'policy_group': policy_group,
-                    'role': 'leaf',
-                    'port_type': 'access',
-                    'interface_type': interface_type,
-                    'admin_state': 'up',
-                    'description': formatted_desc
-                })
-
-        # Trier par node puis par interface
-        interface_mappings.sort(key=lambda x: (x['node'], int(x['interface'].split('/')[1]) if '/' in x['interface'] else 0))
+        # (plus de leafs que de nodes: les leafs en trop sont matchées avec
+        # le mapping node_to_leaf inversé, construit seulement dans ce cas)
+        resolved_leaf_to_node = dict(auto_leaf_to_node)
+        if len(sorted_leaves) > len(sorted_nodes):
+            leaf_to_node = {v.upper(): k for k, v in node_to_leaf.items()}
+            for leaf in sorted_leaves[len(sorted_nodes):]:
+                resolved_leaf_to_node[leaf] = leaf_to_node.get(leaf)
+        interface_mappings = self._build_odd_even_interfaces(
+            leaf_data, resolved_leaf_to_node, smallest_node, ipg_p1p2, ipg_p3, ipg_p4, interface_type
+        )
 
         # Afficher un résumé par policy group
-        pg_counts = {}
-        for m in interface_mappings:
-            pg = m['policy_group']
-            pg_counts[pg] = pg_counts.get(pg, 0) + 1
+        pg_counts = interface_mappings['policy_group'].value_counts().sort_index()
 
         print(f"\n   Répartition par Policy Group:")
-        for pg, count in sorted(pg_counts.items()):
-            print(f"   • {pg}: {count} interfaces")
+        sys.stdout.write(''.join(f"   • {pg}: {count} interfaces\n" for pg, count in pg_counts.items()))
 
         # Finaliser
         self._finalize_interface_config(interface_mappings)
@@ -3459,56 +3875,23 @@ class FabricConverter:
 
         print(f"   Méthode: manuelle")
 
-        # Regrouper les interfaces par (interface_profile, policy_group)
-        grouped = {}
-        for idx, row in access_port_df.iterrows():
-            profile = str(row['interface_profile']) if pd.notna(row['interface_profile']) else ''
-            policy_group = str(row['policy_group']) if pd.notna(row['policy_group']) else ''
-            access_port_selector = str(row['access_port_selector']) if pd.notna(row['access_port_selector']) else ''
-            from_port = row['from_port'] if pd.notna(row['from_port']) else ''
-            to_port = row['to_port'] if pd.notna(row['to_port']) else ''
-            description = str(row['description']) if pd.notna(row['description']) else ''
-
-            if not profile or not policy_group:
-                continue
-
-            if profile not in profile_to_node:
-                continue
+        # Parser les overrides d'interfaces depuis le fichier config
+        # (profile, policy_group) -> list of interfaces
+        interface_overrides = dict(zip(
+            zip(self.interface_config_profiles, self.interface_config_policy_groups),
+            self.interface_config_interface_lists
+        ))
 
-            key = (profile, policy_group)
-            if key not in grouped:
-                grouped[key] = {
-                    'interfaces': [],
-                    'access_port_selector': access_port_selector,
-                    'description': description
-                }
-
-            try:
-                from_p = int(float(from_port))
-                to_p = int(float(to_port))
-                for port in range(from_p, to_p + 1):
-                    interface = f"1/{port}"
-                    if interface not in grouped[key]['interfaces']:
-                        grouped[key]['interfaces'].append(interface)
-            except (ValueError, TypeError):
-                pass
+        # Regrouper les interfaces par (interface_profile, policy_group);
+        # les plages des groupes overridés ne sont pas dépliées
+        grouped = self._group_access_ports(access_port_df, profile_to_node, skip_ports=interface_overrides)
 
         if not grouped:
             print("   ⚠️  Aucun groupe trouvé!")
             return
 
-        # Parser les overrides d'interfaces depuis le fichier config
-        interface_overrides = {}  # (profile, policy_group) -> list of interfaces
-        for line in self.interface_config_interfaces:
-            parts = [p.strip() for p in line.split(',')]
-            if len(parts) >= 3:
-                profile = parts[0]
-                pg = parts[1]
-                ifaces = [p.strip() for p in parts[2:]]
-                interface_overrides[(profile, pg)] = ifaces
-
-        # Construire les interface_mappings
-        interface_mappings = []
+        # Construire les interface_mappings (colonnes en listes parallèles)
+        nodes, ifaces, policy_groups, descriptions = [], [], [], []
         for (profile, policy_group), data in grouped.items():
             node_id = profile_to_node[profile]
 
@@ -3520,77 +3903,34 @@ class FabricConverter:
 
             description = data['description']
 
-            for iface in interfaces:
-                # Nettoyer le format
-                if iface.lower().startswith('eth'):
-                    iface = iface[3:]
-                interface_mappings.append({
-                    'node': node_id,
-                    'interface': iface,
-                    'policy_group': policy_group,
-                    'role': 'leaf',
-                    'port_type': 'access',
-                    'interface_type': interface_type,
-                    'admin_state': 'up',
-                    'description': description
-                })
+            count = len(interfaces)
+            nodes.extend([node_id] * count)
+            ifaces.extend(interfaces)
+            policy_groups.extend([policy_group] * count)
+            descriptions.extend([description] * count)
+
+        # Nettoyer le format (préfixe eth retiré en une passe vectorisée)
+        ifaces = pd.Series(ifaces, dtype=object).str.replace(_ETH_PREFIX_RE, '', n=1, regex=True).tolist()
+
+        # Créer le DataFrame
+        interface_config_df = self._interface_config_frame(nodes, ifaces, policy_groups, descriptions, interface_type)
 
         # Appliquer les descriptions personnalisées
         if self.interface_config_node_to_leaf and self.interface_config_descriptions:
-            node_to_leaf = self.interface_config_node_to_leaf
-            descriptions_map = {}
+            descriptions_map = self._build_descriptions_map(self._config_descriptions_data(),
+                                                            self.interface_config_node_to_leaf)
 
-            for line in self.interface_config_descriptions:
-                parts = line.split()
-                if len(parts) >= 3:
-                    leaf = parts[0].upper()
-                    try:
-                        iface_num = int(parts[1])
-                        iface = f"1/{iface_num}"
-                    except ValueError:
-                        continue
-
-                    # Trouver le node_id correspondant au leaf
-                    node_for_leaf = None
-                    for node, leaf_name in node_to_leaf.items():
-                        if leaf_name.upper() == leaf:
-                            node_for_leaf = node
-                            break
-
-                    if node_for_leaf:
-                        desc_text = ' '.join(parts[2:]).upper()
-
-                        # Formater: (T:SRV E:{AVANT-TIRET} I:{APRÈS-TIRET})
-                        if '-' in desc_text:
-                            first_dash = desc_text.index('-')
-                            e_part = desc_text[:first_dash]
-                            i_part = desc_text[first_dash+1:]
-                        else:
-                            e_part = desc_text
-                            i_part = ''
-
-                        formatted_desc = f"(T:SRV E:{e_part} I:{i_part})"
-                        descriptions_map[(node_for_leaf, iface)] = formatted_desc
-
-            # Appliquer
-            updated_count = 0
-            for mapping in interface_mappings:
-                key = (mapping['node'], mapping['interface'])
-                if key in descriptions_map:
-                    mapping['description'] = descriptions_map[key]
-                    updated_count += 1
+            # Appliquer (jointure vectorisée)
+            updated_count = self._apply_descriptions_map(interface_config_df, descriptions_map)
 
             if updated_count:
                 print(f"   ✅ {updated_count} descriptions personnalisées appliquées")
 
-        # Créer le DataFrame
-        if interface_mappings:
-            interface_config_df = pd.DataFrame(interface_mappings)
-            columns_order = ['node', 'interface', 'policy_group', 'role', 'port_type',
-                           'interface_type', 'admin_state', 'description']
-            interface_config_df = interface_config_df[columns_order]
+        if len(interface_config_df):
+            interface_config_df = self._categorize_interface_columns(interface_config_df)
 
             self.excel_data['interface_config'] = interface_config_df
+            self._data_version += 1
 
             if 'interface_policy_leaf_profile' in self.excel_data:
                 del self.excel_data['interface_policy_leaf_profile']
@@ -3598,7 +3938,7 @@ class FabricConverter:
             if 'access_port_to_int_policy_leaf' in self.excel_data:
                 del self.excel_data['access_port_to_int_policy_leaf']
 
-            print(f"   ✅ interface_config généré: {len(interface_mappings)} lignes")
+            print(f"   ✅ interface_config généré: {len(interface_config_df)} lignes")
             print(f"   • Onglets sources supprimés")
 
     # =========================================================================
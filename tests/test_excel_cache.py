@@ -0,0 +1,33 @@
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+pytest.importorskip('pyarrow')
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fabric_converter_test import read_excel_sheets, read_excel_sheets_cached
+
+
+def test_read_excel_sheets_cached_round_trip(tmp_path):
+    excel_file = tmp_path / 'source.xlsx'
+    with pd.ExcelWriter(excel_file, engine='openpyxl') as writer:
+        pd.DataFrame({
+            'tenant': ['TN1', 'TN2', None],
+            'vlan': [10, 20, 30],
+            'mtu': [1500.0, None, 9000.0],
+        }).to_excel(writer, sheet_name='bd', index=False)
+        pd.DataFrame({'node_id': [101, 102]}).to_excel(writer, sheet_name='node', index=False)
+    cache_dir = tmp_path / 'cache'
+
+    expected = read_excel_sheets(str(excel_file))
+    written = read_excel_sheets_cached(str(excel_file), str(cache_dir))
+    cached = read_excel_sheets_cached(str(excel_file), str(cache_dir))
+
+    assert len(list(cache_dir.iterdir())) == 1
+    for sheets in (written, cached):
+        assert list(sheets) == list(expected)
+        for sheet_name, df in expected.items():
+            pd.testing.assert_frame_equal(sheets[sheet_name], df)
@@ -0,0 +1,25 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fabric_converter_test import FabricConverter
+
+
+def test_save_excel_round_trip_multi_column(tmp_path):
+    converter = FabricConverter(str(tmp_path / 'source.xlsx'))
+    converter.output_excel = str(tmp_path / 'source_converted.xlsx')
+    df = pd.DataFrame({
+        'a': [1, 2, 3],
+        'b': ['x', 'y', 'z'],
+        'c': [1.5, np.nan, 3.5],
+    })
+    converter.excel_data = {'bd': df}
+
+    converter.save_excel()
+
+    result = pd.read_excel(converter.output_excel, sheet_name='bd')
+    pd.testing.assert_frame_equal(result, df, check_dtype=False)